@@ -0,0 +1,80 @@
+"""
+Compares fetching a query into a pandas.DataFrame row by row (QueryTool.run) against
+fetching it as NumPy arrays (QueryTool.run(decode='numpy')) on a local PostgreSQL
+
+The rows are generated by the server, no tables are created.
+
+Usage: python benchmarks/bench_decoding.py --database postgres --user postgres [--rows 1000000]
+"""
+
+# built-ins
+import time
+import argparse
+
+from vs_library.database import ConnectionInfo, PostgreSQL, QueryTool
+
+
+STATEMENT = '''
+    SELECT i AS candidate_id,
+           i::BIGINT * 1000 AS office_candidate_id,
+           i::FLOAT8 / 7 AS score,
+           DATE '1990-01-01' + i % 12000 AS statusdate,
+           'Last' || i AS lastname,
+           CASE WHEN i % 10 = 0 THEN NULL ELSE 'First' || i END AS firstname
+    FROM generate_series(1, :rows) AS i
+    '''
+
+
+def timed_run(query_tool, decode, repeat):
+    durations = []
+
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        success, message = query_tool.run(decode=decode)
+        df = query_tool.results(as_format='pandas_df')
+        durations.append(time.perf_counter() - start_time)
+
+        if not success:
+            raise RuntimeError(message)
+
+    return min(durations), df
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=5432)
+    parser.add_argument('--database', default='postgres')
+    parser.add_argument('--user', default='postgres')
+    parser.add_argument('--password', default=None)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    connection_adapter = PostgreSQL(ConnectionInfo(host=args.host, port=args.port, database=args.database,
+                                                   user=args.user, password=args.password))
+    success, message = connection_adapter.connect(autocommit=True)
+    print(message)
+
+    if not success:
+        return
+
+    try:
+        query_tool = QueryTool(connection_adapter)
+        query_tool.query = (STATEMENT, {'rows': args.rows})
+
+        results = {}
+        for decode in ('python', 'numpy'):
+            seconds, df = timed_run(query_tool, decode, args.repeat)
+            results[decode] = df
+            print(f"{decode:<10}{seconds:>8.3f}s{len(df):>10} rows{df.memory_usage(deep=True).sum() / 1024 ** 2:>10.1f} MB")
+
+        assert len(results['python']) == len(results['numpy'])
+        assert (results['python']['score'] == results['numpy']['score']).all()
+
+    finally:
+        connection_adapter.disconnect()
+
+
+if __name__ == '__main__':
+    main()
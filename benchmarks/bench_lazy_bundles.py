@@ -0,0 +1,69 @@
+"""
+Measures the time and memory taken to construct TBSettings, whose six settings screens
+are built on first visit, against building every screen upfront as it used to
+
+Usage: python benchmarks/bench_lazy_bundles.py [--repeat 200]
+"""
+
+# built-ins
+import time
+import argparse
+import tracemalloc
+from types import SimpleNamespace
+
+from vs_library.cli import LazyNode
+from vs_library.tools import pandas_extension_cli
+
+
+class ColumnsToGet(list):
+    allow_overwrite = False
+
+
+def tb_matcher():
+
+    """A stand-in for a tabular matcher, only its attributes are used to build the screens"""
+
+    config = SimpleNamespace(columns_to_get=ColumnsToGet(), columns_to_match={}, columns_to_group={},
+                             thresholds_by_column={}, scorers_by_column={}, cutoffs_by_column={},
+                             x_columns=['name', 'state'], y_columns=['name', 'state'])
+
+    return SimpleNamespace(config=config, required_threshold=75)
+
+
+def construct(eager):
+    settings = pandas_extension_cli.TBSettings(tb_matcher())
+
+    if eager:
+        for node in list(settings.entry_node.children.values()):
+            if isinstance(node, LazyNode):
+                node.build()
+
+    return settings
+
+
+def measure(eager, repeat):
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        construct(eager)
+    seconds = (time.perf_counter() - start_time) / repeat
+
+    tracemalloc.start()
+    settings = construct(eager)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return seconds, size, settings
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    for label, eager in (("lazy", False), ("eager", True)):
+        seconds, size, _ = measure(eager, args.repeat)
+        print(f"{label:<8}{seconds * 1000:>8.3f}ms{size / 1024:>10.1f} KB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Compares reading a large delimited file with pandas.read_csv against
+pandas_extension.MappedDelimitedFile (chunked and parallel)
+
+Usage: python benchmarks/bench_mapped_reader.py [--rows 2000000] [--processes 4]
+"""
+
+# built-ins
+import os
+import time
+import argparse
+import tempfile
+
+# external packages
+import numpy
+import pandas
+
+from vs_library.tools import pandas_extension
+from vs_library.vsdb import references
+
+
+def synthetic_file(filepath, rows):
+
+    """Writes a candidate-like csv file of the given number of rows"""
+
+    rng = numpy.random.default_rng(0)
+    states = numpy.array(list(references.STATE))
+
+    df = pandas.DataFrame({
+        'candidate_id': numpy.arange(rows),
+        'firstname': rng.choice(['John', 'Mary', 'Ana', 'Lee', 'Sam'], rows),
+        'lastname': rng.choice(['Smith', 'Garcia', 'Nguyen', 'Brown', 'Lopez'], rows),
+        'state_id': rng.choice(states, rows),
+        'score': rng.random(rows).round(4),
+        # zip codes with leading zeros that are numbers to the ranges that do not reach
+        # the alphanumeric codes at the end, the parallel read must still return text
+        'zip': [f"{z:05d}" for z in rng.integers(0, 100000, rows)]
+        })
+
+    df.loc[df.index[-10:], 'zip'] = 'A1234'
+
+    df.to_csv(filepath, index=False)
+
+
+def timed(label, function):
+    start_time = time.perf_counter()
+    result = function()
+    print(f"{label:<40}{time.perf_counter() - start_time:>8.2f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=2000000)
+    parser.add_argument('--processes', type=int, default=os.cpu_count())
+    parser.add_argument('--chunksize', type=int, default=250000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, 'synthetic.csv')
+        synthetic_file(filepath, args.rows)
+        print(f"{args.rows} rows, {round(os.path.getsize(filepath) / 1024 ** 2, 1)} MB\n")
+
+        expected = timed("pandas.read_csv", lambda: pandas.read_csv(filepath, low_memory=False))
+
+        with pandas_extension.MappedDelimitedFile(filepath) as mapped:
+            timed("MappedDelimitedFile (index)", lambda: pandas_extension.MappedDelimitedFile(filepath).close())
+            chunks = timed("MappedDelimitedFile.iter_chunks",
+                           lambda: [len(c) for c in mapped.iter_chunks(args.chunksize)])
+            df = timed(f"MappedDelimitedFile.read_parallel ({args.processes})",
+                       lambda: mapped.read_parallel(processes=args.processes))
+
+        assert sum(chunks) == len(expected)
+        assert df.equals(expected)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+Measures PandasMatcher.match on generated rows, without the score cache, then with the cache
+keeping every candidate of df_from or the top_k of each row by its combined score, matching
+again after only the cutoff has changed, when the cached scores are aggregated again
+
+Two cases are generated: a single column of names that are nearly all unique, and first names,
+last names and states shared by many rows. The matches with the cache are compared to the
+matches without it, which score every candidate
+
+Usage: python benchmarks/bench_matcher_scores.py [--rows-to 300] [--rows-from 3000] [--top-k 50]
+"""
+
+# built-ins
+import time
+import random
+import string
+import argparse
+
+import pandas
+
+from vs_library.tools.pandas_extension import PandasMatcher
+
+
+def _word(rng):
+    return ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8)))
+
+
+def _misspell(rng, value):
+    return value[:-1] + rng.choice(string.ascii_lowercase)
+
+
+def unique_names(rows_to, rows_from, seed=0):
+    rng = random.Random(seed)
+
+    df_from = pandas.DataFrame({'name': [f"{_word(rng)} {_word(rng)}" for _ in range(rows_from)],
+                                'id': [str(i) for i in range(rows_from)]})
+
+    df_to = df_from.sample(rows_to, random_state=seed)[['name']].reset_index(drop=True)
+    df_to['name'] = [_misspell(rng, name) for name in df_to['name']]
+
+    return df_to, df_from
+
+
+def shared_values(rows_to, rows_from, seed=0):
+    rng = random.Random(seed)
+
+    first_names = [_word(rng) for _ in range(40)]
+    last_names = [_word(rng) for _ in range(rows_from // 10)]
+    states = ['WA', 'OR', 'CA', 'ID', 'NV']
+
+    df_from = pandas.DataFrame({'first_name': [rng.choice(first_names) for _ in range(rows_from)],
+                                'last_name': [rng.choice(last_names) for _ in range(rows_from)],
+                                'state': [rng.choice(states) for _ in range(rows_from)],
+                                'id': [str(i) for i in range(rows_from)]})
+
+    df_to = df_from.sample(rows_to, random_state=seed)[['first_name', 'last_name', 'state']].reset_index(drop=True)
+    df_to['first_name'] = [_misspell(rng, name) if rng.random() < 0.3 else name for name in df_to['first_name']]
+    df_to['last_name'] = [_misspell(rng, name) if rng.random() < 0.3 else name for name in df_to['last_name']]
+
+    return df_to, df_from
+
+
+def measure(df_to, df_from, cache_scores, top_k):
+    matcher = PandasMatcher(cache_scores=cache_scores)
+    matcher.df_to = df_to
+    matcher.df_from = df_from
+    matcher.columns_to_get = ['id']
+    matcher.top_k = top_k
+
+    start_time = time.perf_counter()
+    df_matched, _ = matcher.match()
+    first = time.perf_counter() - start_time
+
+    matcher.cutoff = True
+    start_time = time.perf_counter()
+    df_again, _ = matcher.match()
+    again = time.perf_counter() - start_time
+
+    return first, again, matcher.scores.nbytes, (df_matched, df_again)
+
+
+def differ(exact, kept):
+    return ((exact['row_index'].astype(str) != kept['row_index'].astype(str)) |
+            (exact['match_status'] != kept['match_status'])).sum()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows-to', type=int, default=300)
+    parser.add_argument('--rows-from', type=int, default=3000)
+    parser.add_argument('--top-k', type=int, default=50)
+    args = parser.parse_args()
+
+    modes = (("no cache", False, None), ("every candidate", True, None), (f"top {args.top_k}", True, args.top_k))
+
+    for case, generate in (("unique names", unique_names), ("shared first, last names and states", shared_values)):
+        print(case)
+        df_to, df_from = generate(args.rows_to, args.rows_from)
+        results = {}
+
+        for label, cache_scores, top_k in modes:
+            first, again, size, results[label] = measure(df_to, df_from, cache_scores, top_k)
+            print(f"  {label:<18}match{first:>8.3f}s   again{again:>8.3f}s{size / 1024 ** 2:>10.1f} MB of scores")
+
+        exact = results["no cache"]
+
+        for label, _, _ in modes[1:]:
+            rows = [differ(e, k) for e, k in zip(exact, results[label])]
+            print(f"  {rows[0]} of {len(exact[0])} rows matched differently with {label}, {rows[1]} after the cutoff")
+
+
+if __name__ == '__main__':
+    main()
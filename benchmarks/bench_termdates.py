@@ -0,0 +1,183 @@
+"""
+Compares Incumbents.by_electdates against Incumbents.by_termdates on a local
+PostgreSQL populated with synthetic office_candidate data
+
+The tables are created in their own schema, which is dropped afterwards.
+
+Usage: python benchmarks/bench_termdates.py --database postgres --user postgres [--rows 1000000] [--partial-dates]
+"""
+
+# built-ins
+import time
+import json
+import argparse
+
+from vs_library.database import ConnectionInfo, PostgreSQL, QueryTool
+from vs_library.vsdb import queries
+
+
+SCHEMA = 'vs_bench'
+
+SETUP_STATEMENTS = (
+    f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE",
+    f"CREATE SCHEMA {SCHEMA}",
+    f"SET search_path TO {SCHEMA}",
+    '''
+    CREATE TABLE state AS
+    SELECT chr(65 + i / 26) || chr(65 + i % 26) AS state_id, 'State ' || i AS name
+    FROM generate_series(0, 55) AS i
+    ''',
+    '''
+    CREATE TABLE office AS
+    SELECT i AS office_id, 'Office ' || i AS name, (ARRAY['P','C','G','L','J','S','K'])[1 + i % 7] AS officetype_id
+    FROM generate_series(1, 400) AS i
+    ''',
+    '''
+    CREATE TABLE districtname AS
+    SELECT i AS districtname_id, 'District ' || i AS name FROM generate_series(1, 5000) AS i
+    ''',
+    '''
+    CREATE TABLE party AS SELECT i AS party_id, 'Party ' || i AS name FROM generate_series(1, 50) AS i
+    ''',
+    '''
+    CREATE TABLE candidate AS
+    SELECT i AS candidate_id, 'First' || i AS firstname, NULL::TEXT AS nickname, NULL::TEXT AS middlename,
+           'Last' || i AS lastname, NULL::TEXT AS suffix
+    FROM generate_series(1, %(rows)s) AS i
+    ''',
+    # term dates are full dates or blanks, on PostgreSQL 10 and later by_electdates raises
+    # "date/time field value out of range" on partial dates, as to_date(termend, 'mm/dd/yyyy')
+    # is evaluated on every row; --partial-dates adds them to time by_termdates alone
+    '''
+    CREATE TABLE office_candidate AS
+    SELECT i AS office_candidate_id,
+           1 + (random() * (%(rows)s - 1))::INT AS candidate_id,
+           1 + (random() * 399)::INT AS office_id,
+           chr(65 + (i %% 56) / 26) || chr(65 + (i %% 56) %% 26) AS state_id,
+           1 + (random() * 4999)::INT AS districtname_id,
+           (ARRAY[1, 2, 3])[1 + i %% 3] AS officecandidatestatus_id,
+           CASE WHEN i %% 10 = 0 THEN NULL
+                WHEN i %% 10 = 1 AND %(partial)s THEN to_char(start_date, 'yyyy')
+                WHEN i %% 10 = 2 AND %(partial)s THEN to_char(start_date, 'mm/yyyy')
+                ELSE to_char(start_date, 'mm/dd/yyyy') END AS termstart,
+           CASE WHEN i %% 7 = 0 THEN NULL
+                WHEN i %% 7 = 1 AND %(partial)s THEN to_char(start_date + 1460, 'yyyy')
+                ELSE to_char(start_date + 1460, 'mm/dd/yyyy') END AS termend
+    FROM (SELECT i, DATE '1990-01-01' + (random() * 12000)::INT AS start_date
+          FROM generate_series(1, %(rows)s) AS i) AS t
+    ''',
+    '''
+    CREATE TABLE office_candidate_party AS
+    SELECT office_candidate_id, 1 + office_candidate_id %% 50 AS party_id FROM office_candidate
+    ''',
+    "CREATE INDEX ON candidate (candidate_id)",
+    "CREATE INDEX ON office_candidate (office_candidate_id)",
+    "CREATE INDEX ON office_candidate_party (office_candidate_id)",
+    "ANALYZE",
+    )
+
+
+def timed_run(query_tool, query, repeat):
+    query_tool.query = query
+    durations = []
+
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        success, message = query_tool.run()
+        durations.append(time.perf_counter() - start_time)
+
+        if not success:
+            raise RuntimeError(message)
+
+    return min(durations), query_tool.results()[0]
+
+
+def scans(connection_adapter, query):
+
+    """Returns how each table of a query's plan is read, ex. {'office_candidate_termdate': 'Index Scan'}"""
+
+    statement, values = query
+    cursor = connection_adapter.execute(f"EXPLAIN (FORMAT JSON) {statement}", values)
+    output = cursor.fetchall()[0][0]
+    cursor.close()
+
+    plan = json.loads(output) if isinstance(output, str) else output
+    found = {}
+
+    def walk(node):
+        if 'Relation Name' in node:
+            found.setdefault(node['Relation Name'], set()).add(node['Node Type'])
+        for child in node.get('Plans', []):
+            walk(child)
+
+    walk(plan[0]['Plan'])
+    return {table: ', '.join(sorted(types)) for table, types in found.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=5432)
+    parser.add_argument('--database', default='postgres')
+    parser.add_argument('--user', default='postgres')
+    parser.add_argument('--password', default=None)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--partial-dates', action='store_true')
+    args = parser.parse_args()
+
+    connection_adapter = PostgreSQL(ConnectionInfo(host=args.host, port=args.port, database=args.database,
+                                                   user=args.user, password=args.password))
+    success, message = connection_adapter.connect(autocommit=True)
+    print(message)
+
+    if not success:
+        return
+
+    try:
+        for statement in SETUP_STATEMENTS:
+            connection_adapter.execute(statement % {'rows': args.rows, 'partial': str(args.partial_dates)}
+                                       if '%(rows)s' in statement else statement.replace('%%', '%')).close()
+
+        start_time = time.perf_counter()
+        print(queries.TermDates.create(connection_adapter)[1],
+              f"({round(time.perf_counter() - start_time, 2)}s)")
+        connection_adapter.execute("ANALYZE office_candidate_termdate").close()
+
+        query_tool = QueryTool(connection_adapter)
+        states = [row[0] for row in connection_adapter.execute("SELECT state_id FROM state").fetchall()]
+
+        # a past period, where both term dates are unselective ranges, and the latest years,
+        # where only the terms that have not ended are past the start of the period
+        cases = (("2010-2012, 4 states", queries.Incumbents(['2010', '2012'], [], ['C', 'L', 'S'],
+                                                           ['AA', 'AB', 'BA', 'CC'])),
+                 ("2025, every state", queries.Incumbents(['2025'], [], ['C', 'L', 'S'], states)))
+
+        for case, incumbents in cases:
+            print(f"\n{case}")
+
+            modes = (('by_termdates', incumbents.by_termdates()), ) if args.partial_dates else \
+                    (('by_electdates', incumbents.by_electdates()), ('by_termdates', incumbents.by_termdates()))
+            candidates = []
+
+            for label, query in modes:
+                seconds, rows = timed_run(query_tool, query, args.repeat)
+                candidates.append(sorted(row[0] for row in rows))
+                print(f"{label:<16}{seconds:>8.3f}s{len(rows):>10} rows   office_candidate_termdate: "
+                      f"{scans(connection_adapter, query).get('office_candidate_termdate', '-')}")
+
+            # DISTINCT ON (candidate_id) keeps any of a candidate's offices, so only candidates are compared
+            if len(candidates) > 1:
+                print("same candidates" if candidates[0] == candidates[1] else "candidates differ")
+
+    finally:
+        # a failed query disconnects the adapter
+        if not connection_adapter.connected:
+            connection_adapter.connect(autocommit=True)
+
+        connection_adapter.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE").close()
+        connection_adapter.disconnect()
+
+
+if __name__ == '__main__':
+    main()
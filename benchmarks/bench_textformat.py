@@ -0,0 +1,67 @@
+"""
+Compares the ways of formatting the text of a full menu redraw (the hideout menu, a prompt
+and a table): looking up the palette on every call as textformat.apply used to,
+a precompiled textformat.Style and the cached textformat.apply
+
+Usage: python benchmarks/bench_textformat.py [--redraws 20000]
+"""
+
+# built-ins
+import time
+import argparse
+
+from vs_library.cli import textformat
+
+
+# (text, emphases, text_color, bg_color) formatted on every redraw
+REDRAW = [
+    ("Hideout Menu", ['bold'], 'cyan', None),
+    ("To open hideout menu, press Ctrl + C\n", ['italic'], 'cyan', None),
+    ("Please enter one of the options above\n", ['italic'], None, None),
+    ("Your input(s) are not recognizable, please try again.", ['italic'], 'red', None),
+    ("Incumbent Query Form", ['bold', 'underline'], None, None),
+    ("Response", ['bold'], None, None),
+    ("Shows the filled incumbent query form", ['italic'], None, None),
+    ("YES", ['bold', 'italic'], 'bright_red', None),
+    ("NO", ['bold', 'italic'], 'bright_green', None),
+    ("Going Back...", ['italic'], 'magenta', None),
+    ] * 3
+
+
+def per_call(redraws):
+    for _ in range(redraws):
+        for text, emphases, text_color, bg_color in REDRAW:
+            textformat._cast(text, textformat._sequences(emphases, text_color, bg_color))
+
+
+def compiled(redraws):
+    styles = [(text, textformat.Style(emphases, text_color, bg_color))
+              for text, emphases, text_color, bg_color in REDRAW]
+
+    for _ in range(redraws):
+        for text, style in styles:
+            style(text)
+
+
+def cached(redraws):
+    for _ in range(redraws):
+        for text, emphases, text_color, bg_color in REDRAW:
+            textformat.apply(text, emphases, text_color, bg_color)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--redraws', type=int, default=20000)
+    args = parser.parse_args()
+
+    for label, function in (("palette looked up per call", per_call),
+                            ("textformat.Style", compiled),
+                            ("textformat.apply (cached)", cached)):
+        start_time = time.perf_counter()
+        function(args.redraws)
+        seconds = time.perf_counter() - start_time
+        print(f"{label:<30}{seconds:>8.3f}s{seconds / args.redraws * 1e6:>10.1f}us per redraw")
+
+
+if __name__ == '__main__':
+    main()
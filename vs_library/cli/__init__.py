@@ -2,7 +2,12 @@ from .cli import (
     Engine, 
     Node, 
     NodeBundle,
-    DecoyNode)
+    DecoyNode,
+    LazyNode,
+    ScriptedInput)
+
+from .renderer import Renderer
+from .trace import Tracer
 
 from . import (
     objects,
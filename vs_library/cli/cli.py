@@ -1,11 +1,12 @@
 
 # built-ins
-import os
-import time
+import builtins
+from contextlib import nullcontext
 
 # internal packages
-from . import textformat
-from .objects import Prompt, Command
+from . import textformat, objects
+from .objects import Prompt, Command, Table
+from .renderer import Renderer
 
 
 class Engine:
@@ -27,17 +28,44 @@ class Engine:
     
     restart_menu : cli.objects.Prompt
         A menu that presents the options for the user to restart or quit the application
+
+    page_menu : cli.objects.Prompt
+        A menu that presents the options for the user to move between the pages of a Table
+
+    renderer : cli.renderer.Renderer
+        Draws the output of nodes on the terminal
+
+    pacing : str
+        'interactive', 'fast' or 'none', how long messages stay on screen, see cli.objects.Pacing
+
+    tracer : cli.trace.Tracer
+        Records the time spent on each node when given
     """
 
-    def __init__(self, start_node):
+    def __init__(self, start_node, renderer=None, pacing=None, tracer=None):
 
         """
         Parameters
         ----------
         start_node : cli.Node
             Starting node of the engine that contains other child nodes
+
+        renderer : cli.renderer.Renderer, optional
+            Draws on sys.stdout by default
+
+        pacing : str, optional
+            Pacing policy of the engine and the CliObjects it runs,
+            the policy of cli.objects.pacing if not given
+
+        tracer : cli.trace.Tracer, optional
+            Records execute, draw and input wait times of nodes and the traversal between them
         """
 
+        self.renderer = renderer if renderer else Renderer()
+        self.tracer = tracer
+
+        self.__pacing = objects.Pacing(pacing if pacing else objects.pacing.policy)
+
         self.__current_node = start_node
         self.__node_selection = [start_node]
 
@@ -45,26 +73,77 @@ class Engine:
         self.hideout_menu.options = {
             '1': "Return",
             '2': Command(self.go_back, value="Go back", respond=True,
-                                 command=Command(lambda: time.sleep(0.3))),
+                                 command=Command(lambda: self.pause('transition'))),
             'R': Command(self.restart, value="Restart", respond=True,
-                                 command=Command(lambda: time.sleep(0.3))),
+                                 command=Command(lambda: self.pause('transition'))),
             'Q': Command(self.quit, value="Quit")
             }
 
         self.restart_menu = Prompt("You have reached the end, what would you like to do?")
         self.restart_menu.options = {
             '1': Command(self.restart, value="Restart", respond=True,
-                                 command=Command(lambda: time.sleep(0.3))),
+                                 command=Command(lambda: self.pause('transition'))),
             '2': Command(self.quit, value="Quit")}
 
+        self.page_menu = Prompt("Which page would you like to see?")
+
+        # the engine's own menus pause with its pacing
+        for menu in (self.hideout_menu, self.restart_menu, self.page_menu):
+            menu.engine = self
+
+    @property
+    def pacing(self):
+        return self.__pacing.policy
+
+    @pacing.setter
+    def pacing(self, policy):
+        self.__pacing.policy = policy
+
+    def pause(self, event):
+
+        """Pauses for an event with the engine's pacing, see cli.objects.Pacing.pause"""
+
+        self.__pacing.pause(event)
+
+    def span(self, name, kind):
+
+        """Times the code within the context if a tracer is given, see Tracer.span"""
+
+        return self.tracer.span(name, kind) if self.tracer else nullcontext()
+
     def clear_terminal(self):
 
         """Clears any existing output on the terminal"""
 
-        if os.name == 'nt':
-            os.system('cls')
-        else:
-            os.system('clear')
+        self.renderer.clear()
+
+    def page(self, node):
+
+        """Lets the user move between the pages of a node's Table until they continue"""
+
+        table = node.cliobject
+
+        while True:
+            options = {}
+
+            if table.page < table.pages - 1:
+                options['N'] = Command(table.next_page, value="Next page")
+            if table.page > 0:
+                options['P'] = Command(table.prev_page, value="Previous page")
+
+            options['C'] = "Continue"
+
+            self.page_menu.options = options
+            self.page_menu.draw()
+
+            if self.page_menu.responses == 'C':
+                break
+
+            # only the page is drawn again, the table's command is not executed
+            if node.clear_screen:
+                self.clear_terminal()
+
+            table.draw()
 
     def go_back(self):
 
@@ -90,8 +169,8 @@ class Engine:
 
         """Things to do when engine is stopped"""
 
-        print(textformat.apply("\nStopping Engine...", emphases=['italic'], text_color='magenta'))
-        time.sleep(0.5)
+        print(textformat.apply("\nStopping Engine...", emphases=['italic'], text_color='magenta'), flush=True)
+        self.pause('quit')
         self.clear_terminal()
 
     def run(self, loop=False):
@@ -105,58 +184,141 @@ class Engine:
             If True, will allow the user to restart the application
         """
 
+        with self.tracer.waiting() if self.tracer else nullcontext():
+            self._traverse(loop)
+
+    def _traverse(self, loop):
         while True:
             try:
-                if self.__current_node:
-                    self.__current_node.engine = self
-                    print()
+                # what a node clears and draws is written to the terminal at once
+                with self.renderer.frame():
+                    if self.__current_node:
+                        node = self.__current_node
+                        node.engine = self
+                        print()
 
-                    if self.__current_node.clear_screen:
-                        self.clear_terminal()
+                        with self.span(node.name, 'node'):
+                            if node.clear_screen:
+                                self.clear_terminal()
 
-                    if self.__current_node.show_hideout:
-                        print(textformat.apply("To open hideout menu, press Ctrl + C\n", emphases=['italic'], text_color='cyan'))
+                            if node.show_hideout:
+                                print(textformat.apply("To open hideout menu, press Ctrl + C\n", emphases=['italic'], text_color='cyan'))
 
-                    # CTRL + C will trigger the hideout menu
-                    
-                    self.__current_node.execute()
+                            # CTRL + C will trigger the hideout menu
+                            
+                            node.execute()
 
-                    if self.__current_node.acknowledge:
-                        _ = input(textformat.apply("\nPress ENTER to continue.", emphases=['blink'], text_color='magenta'))
+                            if isinstance(node.cliobject, Table) and node.cliobject.pages > 1:
+                                self.page(node)
 
-                    # automatically set next node to the only child
-                    if len(self.__current_node.children) == 1:
-                        self.__current_node.set_next(next(iter(self.__current_node.children.values())))
-                    
-                    if self.__current_node.store and self.__current_node.id != self.__node_selection[-1].id:
-                            self.__node_selection.append(self.__current_node)
+                            if node.acknowledge:
+                                _ = input(textformat.apply("\nPress ENTER to continue.", emphases=['blink'], text_color='magenta'))
 
-                    self.__current_node = self.__current_node.next
+                        # automatically set next node to the only child
+                        if len(node.children) == 1:
+                            node.set_next(next(iter(node.children.values())))
+                        
+                        if node.store and node.id != self.__node_selection[-1].id:
+                                self.__node_selection.append(node)
 
-                else:
-                    if loop:
-                        self.clear_terminal()
-                        self.restart_menu.draw()
+                        self.__current_node = node.next
+
+                        if self.tracer:
+                            self.tracer.edge(node.name, node.next.name if node.next else 'end')
 
-                        if self.restart_menu.responses == '2':
-                            break
                     else:
-                        break
+                        if loop:
+                            self.clear_terminal()
+                            self.restart_menu.draw()
+
+                            if self.restart_menu.responses == '2':
+                                break
+                        else:
+                            break
                     
             except KeyboardInterrupt:
+                interrupted = self.__current_node
                 
                 # Loop to prevent user from further triggering another KeyboardInterrupt
                 while True:
                     try:
-                        self.clear_terminal()
-                        self.hideout_menu.draw()
+                        with self.renderer.frame(), self.span('hideout-menu', 'node'):
+                            self.clear_terminal()
+                            self.hideout_menu.draw()
                         break
                     except KeyboardInterrupt:
                         pass
 
+                if self.tracer and interrupted and self.__current_node is not interrupted:
+                    self.tracer.edge(interrupted.name, self.__current_node.name if self.__current_node else 'end')
+
                 if self.hideout_menu.responses == 'Q':
                     break
 
+class ScriptedInput:
+
+    """
+    Answers every input() with the next of a list of responses, so that a flow of nodes
+    can be run without a user. Use as a context manager around Engine.run, preferably
+    with the 'none' pacing:
+
+        with ScriptedInput(['1', '2020', 'Y']) as script:
+            Engine(start_node, pacing='none').run()
+
+    Attributes
+    ----------
+    transcript : list
+        (prompt, response) of every input answered
+    """
+
+    def __init__(self, responses, echo=True):
+
+        """
+        Parameters
+        ----------
+        responses : list
+            Strings given to input() in order, Ctrl + C can be given as KeyboardInterrupt
+
+        echo : bool, default=True
+            If True, prompts and responses are printed as if typed
+        """
+
+        self.echo = echo
+        self.transcript = []
+
+        self.__responses = list(responses)
+        self.__input = None
+
+    @property
+    def remaining(self):
+        return list(self.__responses)
+
+    def __call__(self, prompt=''):
+
+        if not self.__responses:
+            raise EOFError(f"No scripted response left for: {prompt.strip()}")
+
+        response = self.__responses.pop(0)
+
+        if response is KeyboardInterrupt:
+            raise KeyboardInterrupt
+
+        self.transcript.append((prompt, response))
+
+        if self.echo:
+            print(f"{prompt}{response}")
+
+        return response
+
+    def __enter__(self):
+        self.__input = builtins.input
+        builtins.input = self
+        return self
+
+    def __exit__(self, *args):
+        builtins.input = self.__input
+
+
 class Node:
 
     """
@@ -243,14 +405,25 @@ class Node:
         
         """Draw and/or executes the CliObject that the node holds"""
 
+        # timed if the engine has a tracer
+        span = self.__engine.span if self.__engine else lambda name, kind: nullcontext()
+
+        # what is drawn is written before a command runs, and the command prints directly
+        unbuffered = self.__engine.renderer.unbuffered if self.__engine else nullcontext
+
         if self.cliobject.exe_seq == 'before':
-            self.cliobject.execute()
-            self.cliobject.draw()
+            with span(self.name, 'execute'), unbuffered():
+                self.cliobject.execute()
+            with span(self.name, 'draw'):
+                self.cliobject.draw()
         elif self.cliobject.exe_seq == 'after':
-            self.cliobject.draw()
-            self.cliobject.execute()
+            with span(self.name, 'draw'):
+                self.cliobject.draw()
+            with span(self.name, 'execute'), unbuffered():
+                self.cliobject.execute()
         else:
-            self.cliobject.draw()
+            with span(self.name, 'draw'):
+                self.cliobject.draw()
 
     @property
     def id(self):
@@ -281,6 +454,7 @@ class Node:
     def engine(self, e):
         assert isinstance(e, Engine)
         self.__engine = e
+        self.cliobject.engine = e
 
     def engine_call(self, method):
 
@@ -369,3 +543,60 @@ class DecoyNode(Node):
         _object = Command(lambda: None)
         _object.name = 'decoy'
         super().__init__(_object, parent=parent, name=name, show_hideout=False, store=False)
+
+
+class LazyNode(Node):
+
+    """
+    The LazyNode is an extension of Node that builds a NodeBundle the first time it is traversed,
+    then leads to the entry node of that bundle. Screens that are never visited are never built.
+    """
+
+    def __init__(self, factory, name='lazy-node', parent=None):
+
+        """
+        Parameters
+        ----------
+        factory : function
+            Takes no argument and returns the NodeBundle, 
+            ex. lambda: TBSetColumnsToGet(config, parent=menu_node)
+
+        name : str
+            Name for human-readable identification
+
+        parent : cli.Node
+            Parent node that adopts this instance
+        """
+
+        _object = Command(self.build)
+        _object.name = 'lazy'
+        # the bundle is built before the engine looks for the next node
+        _object.exe_seq = 'before'
+
+        self.__factory = factory
+        self.__bundle = None
+
+        super().__init__(_object, parent=parent, name=name, show_hideout=False, store=False)
+
+    @property
+    def built(self):
+        return self.__bundle is not None
+
+    @property
+    def bundle(self):
+
+        """The NodeBundle, built if it has not been yet"""
+
+        self.build()
+        return self.__bundle
+
+    def build(self):
+
+        """Builds the bundle once and sets its entry node as the next node"""
+
+        if self.__bundle is None:
+            self.__bundle = self.__factory()
+            self.adopt(self.__bundle.entry_node)
+
+        self.set_next(self.__bundle.entry_node)
+
@@ -1,7 +1,14 @@
 
 # built-ins
 from abc import ABC, abstractmethod
+import re
+import sys
 import time
+import signal
+import threading
+import multiprocessing
+from types import SimpleNamespace
+from itertools import zip_longest
 
 # internal packages
 from . import textformat
@@ -10,6 +17,50 @@ from . import textformat
 from tabulate import tabulate
 
 
+class Pacing:
+
+    """
+    Pauses that give the user time to read a message before the screen moves on
+
+    'interactive' is meant for people, 'fast' shortens the pauses and 'none' removes them,
+    for scripted runs and tests. Each Engine has its own pacing, which the CliObjects it runs
+    pause with, and CliObjects used outside of an Engine pause with the module's pacing.
+    """
+
+    POLICIES = {
+        'interactive': {'error': 0.75, 'transition': 0.3, 'quit': 0.5},
+        'fast': {'error': 0.1, 'transition': 0.05, 'quit': 0.05},
+        'none': {'error': 0, 'transition': 0, 'quit': 0}
+        }
+
+    def __init__(self, policy='interactive'):
+        self.policy = policy
+
+    @property
+    def policy(self):
+        return self.__policy
+
+    @policy.setter
+    def policy(self, policy):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Pacing policy must be one of {', '.join(self.POLICIES)}")
+
+        self.__policy = policy
+
+    def pause(self, event):
+
+        """Sleeps for the time the policy gives to an event, 'error', 'transition' or 'quit'"""
+
+        seconds = self.POLICIES[self.__policy][event]
+
+        if seconds:
+            time.sleep(seconds)
+
+
+# the pacing of CliObjects that are not run by an Engine, see Engine.pacing
+pacing = Pacing()
+
+
 class CliObject(ABC):
     
     """
@@ -28,14 +79,25 @@ class CliObject(ABC):
     exe_seq : str
         'before' to denote command is executed before object is drawn
         'after' to denote command is executed after object is drawn.
+
+    engine : cli.Engine
+        The Engine running the object, set by the node that holds it
     """
 
+    engine = None
+
     def __init__(self, name, command, exe_seq):
 
         self.name = name
         self.command = command
         self.exe_seq = exe_seq
 
+    def pause(self, event):
+
+        """Pauses for an event with the pacing of the Engine running the object, see Pacing.pause"""
+
+        (self.engine if self.engine else pacing).pause(event)
+
     @abstractmethod
     def draw(self):
         pass
@@ -91,6 +153,251 @@ class Command(CliObject):
         return str(self.value)
 
 
+class Task:
+
+    """
+    Handed to the method of a BackgroundCommand, for the method to report its progress
+    and to check whether the user has asked to cancel it
+
+    Attributes
+    ----------
+    done : float
+        Units of work done so far
+
+    total : float
+        Units of work to do, 0 if unknown
+
+    phase : str
+        What the method is doing, ex. 'Reading', 'Matching'
+    """
+
+    def __init__(self, process=False):
+
+        """
+        Parameters
+        ----------
+        process : bool, default=False
+            If True, the task is shared with a worker process, otherwise with a worker thread
+        """
+
+        if process:
+            self.__done = multiprocessing.Value('d', 0.0, lock=False)
+            self.__total = multiprocessing.Value('d', 0.0, lock=False)
+            self.__phase = multiprocessing.Array('c', 64, lock=False)
+            self.__cancel = multiprocessing.Event()
+        else:
+            # a thread shares the memory of the task, nothing has to be allocated for another process
+            self.__done = SimpleNamespace(value=0.0)
+            self.__total = SimpleNamespace(value=0.0)
+            self.__phase = SimpleNamespace(value=b'')
+            self.__cancel = threading.Event()
+
+    @property
+    def done(self):
+        return self.__done.value
+
+    @property
+    def total(self):
+        return self.__total.value
+
+    @property
+    def phase(self):
+        return self.__phase.value.decode(errors='ignore')
+
+    @property
+    def cancelled(self):
+        return self.__cancel.is_set()
+
+    def cancel(self):
+        self.__cancel.set()
+
+    def update(self, done, total=None, phase=None):
+
+        """Reports the units of work done, and optionally the total and the current phase"""
+
+        self.__done.value = done
+
+        if total is not None:
+            self.__total.value = total
+
+        if phase is not None:
+            self.__phase.value = phase.encode()[:63]
+
+    def __call__(self, update):
+
+        """
+        Takes a ProgressUpdate, so a task can be given as the progress callback of
+        read_spreadsheet, to_spreadsheet, PandasMatcher.match or QueryTool.run
+        """
+
+        self.update(update.done, update.total, update.phase)
+
+
+def _run_task(method, task, results):
+
+    """Runs the method of a BackgroundCommand in a worker process"""
+
+    # Ctrl + C reaches every process of the terminal, the worker is cancelled through the task instead
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    try:
+        results.put((True, method(task)))
+    except Exception as e:
+        results.put((False, f"ERROR: {str(e)}"))
+
+
+class BackgroundCommand(Command):
+
+    """
+    The BackgroundCommand class is a Command that runs its method in a worker thread or process,
+    while the terminal shows how far along it is. Pressing Ctrl + C asks the method to stop
+    instead of opening the hideout menu.
+
+    The method is given a Task, ex. method(task), through which it reports its progress and
+    finds out if it is cancelled (task.cancelled), it is up to the method to stop early.
+    Pressing Ctrl + C a second time stops waiting for the method, a process is terminated
+    while a thread is left running in the background.
+    Chained Commands are executed after the method returns, cancelled or not,
+    so nodes are traversed as with a Command.
+
+    Attributes
+    ----------
+    cancelled : bool
+        If True, the last run was cancelled by the user
+    """
+
+    def __init__(self, method, value='', respond=False, command=None,
+                 process=False, unit='rows', interval=0.2):
+
+        """
+        Parameters
+        ----------
+        method : function
+            Takes a Task and can return a message
+
+        process : bool, default=False
+            If True, the method runs in a separate process, it must then be picklable and
+            anything it changes other than its return message stays in that process
+
+        unit : str, default='rows'
+            What the progress is counted in
+
+        interval : float, default=0.2
+            Seconds between updates of the progress
+        """
+
+        super().__init__(method, value=value, respond=respond, command=command)
+
+        self.process = process
+        self.unit = unit
+        self.interval = interval
+
+        self.cancelled = False
+        self.__message = None
+
+    def draw(self):
+        if self.__message:
+            print(self.__message)
+
+    def execute(self):
+
+        if self.method:
+            task = Task(self.process)
+            self.__message = self._wait(task)
+            self.cancelled = task.cancelled
+
+            if self.respond and not self.exe_seq:
+                self.draw()
+
+        if isinstance(self.command, Command):
+            self.command.execute()
+
+    def progress(self, task, seconds):
+
+        """Returns a line describing the progress of a task, ex. 'Matching 5000/20000 rows, 2500 rows/s, ETA 6s'"""
+
+        rate = task.done / seconds if seconds > 0 else 0
+        line = f"{task.phase} " if task.phase else ""
+
+        if task.total:
+            line += f"{task.done:.0f}/{task.total:.0f} {self.unit}"
+        else:
+            line += f"{task.done:.0f} {self.unit}"
+
+        line += f", {rate:.0f} {self.unit}/s"
+
+        if task.total and rate:
+            line += f", ETA {max(task.total - task.done, 0) / rate:.0f}s"
+
+        return line + f" ({seconds:.1f}s)"
+
+    def _wait(self, task):
+
+        """Runs the method and shows its progress until it returns, Ctrl + C cancels it"""
+
+        if self.process:
+            results = multiprocessing.Queue()
+            worker = multiprocessing.Process(target=_run_task, args=(self.method, task, results), daemon=True)
+
+            def _finished():
+                worker.join(self.interval)
+                return not worker.is_alive()
+        else:
+            results = []
+            returned = threading.Event()
+
+            def _target():
+                try:
+                    results.append((True, self.method(task)))
+                except Exception as e:
+                    results.append((False, f"ERROR: {str(e)}"))
+                finally:
+                    returned.set()
+
+            # Ctrl + C within Thread.join can leave the thread seen as stopped while it runs
+            def _finished():
+                return returned.wait(self.interval)
+
+            worker = threading.Thread(target=_target, daemon=True)
+
+        # progress is written over the same line on a terminal, only once done otherwise
+        live = sys.stdout.isatty()
+        start_time = time.perf_counter()
+        worker.start()
+
+        while True:
+            try:
+                if _finished():
+                    break
+
+                if live:
+                    print(f"\r\033[K{self.progress(task, time.perf_counter() - start_time)}", end='', flush=True)
+
+            except KeyboardInterrupt:
+                if task.cancelled:
+                    # asked twice, a process is stopped outright, a thread cannot be stopped
+                    # so it is left to finish on its own and its results are not waited for
+                    if self.process:
+                        worker.terminate()
+                    break
+
+                task.cancel()
+                print(textformat.apply("\nCancelling...", emphases=['italic'], text_color='magenta'), flush=True)
+
+        seconds = time.perf_counter() - start_time
+        print(f"\r\033[K{self.progress(task, seconds)}" if live else self.progress(task, seconds))
+
+        if self.process:
+            success, message = results.get() if not results.empty() else (False, None)
+        else:
+            success, message = results[0] if results else (False, None)
+
+        if task.cancelled:
+            return textformat.apply("Cancelled.", emphases=['italic'], text_color='red')
+
+        return message
+
+
 class Display(CliObject):
 
     """The Display class is a CliObject that diplays messages on the command line"""
@@ -228,7 +535,7 @@ class Prompt(CliObject):
 
         while not self._verify():
             print(f"{self.__error_msg}\n")
-            time.sleep(0.75) # to provide user acknowledgement if something went wrong
+            self.pause('error') # to provide user acknowledgement if something went wrong
 
             if self.multiple_selection:
                 _multiple(self)
@@ -278,6 +585,10 @@ class Table(CliObject):
     This is dependent on 'tabulate' python package see here:
     https://pypi.org/project/tabulate/
 
+    With a page_size, only one page of rows is formatted and drawn at a time, so drawing
+    a table of any length costs the same. Column widths are kept from page to page and
+    only grow as wider rows are seen. The Engine lets the user move between pages.
+
     Attributes
     ----------
     table_header : str, optional
@@ -286,9 +597,12 @@ class Table(CliObject):
     description : str, optional
         String italicized and left justified at the bottom of the table to provide 
         a description of the table
+
+    page : int
+        Index of the page drawn, starting at 0
     """
 
-    def __init__(self, table, header=True, command=None):
+    def __init__(self, table, header=True, command=None, page_size=None):
 
         """
         Parameters
@@ -298,16 +612,58 @@ class Table(CliObject):
 
         header : bool, default=True
             If true, table emphasize the first row as header
+
+        page_size : int, optional
+            Number of rows drawn at once, all rows are drawn if not given
         """
 
         super().__init__(name='table', command=command, exe_seq='before')
 
-        self.table = table
         self.header = header
+        self.page_size = page_size
+        self.table = table
         
         self.table_header = ""
         self.description = ""
 
+    @property
+    def table(self):
+        return self.__table
+
+    @table.setter
+    def table(self, table):
+        self.__table = table
+        self.__page = 0
+        self.__widths = []
+
+    @property
+    def rows(self):
+
+        """Number of rows, without the header"""
+
+        return max(len(self.__table) - 1, 0) if self.header else len(self.__table)
+
+    @property
+    def pages(self):
+        if not self.page_size:
+            return 1
+
+        return max(-(-self.rows // self.page_size), 1)
+
+    @property
+    def page(self):
+        return min(self.__page, self.pages - 1)
+
+    @page.setter
+    def page(self, page):
+        self.__page = max(min(page, self.pages - 1), 0)
+
+    def next_page(self):
+        self.page += 1
+
+    def prev_page(self):
+        self.page -= 1
+
     def clear(self):
         
         """Clears the table"""
@@ -317,15 +673,29 @@ class Table(CliObject):
         else:
             self.table.clear()
 
+        # pages and column widths start over
+        self.table = self.__table
+
     def draw(self):
         table_str = str(self)
-        table_length = max(map(len, table_str.split('\n')))
+
+        if self.page_size:
+            # every line of the grid is as long as the first
+            table_length = len(_visible(table_str.split('\n', 1)[0]))
+        else:
+            table_length = max(map(len, table_str.split('\n')))
 
         if self.table_header:
             center_header = self.table_header.center(table_length)
             print(textformat.apply(center_header, emphases=['bold']))
 
         print(table_str)
+
+        if self.page_size and self.pages > 1:
+            first = self.page * self.page_size + 1
+            last = min(first + self.page_size - 1, self.rows)
+            print(textformat.apply(f"Page {self.page + 1} of {self.pages}, rows {first}-{last} of {self.rows}",
+                                   emphases=['italic']))
         
         if self.description:
             ljust_desc = self.description.ljust(table_length)
@@ -335,11 +705,103 @@ class Table(CliObject):
         if isinstance(self.command, Command):
             self.command.execute()
 
+    def _page_str(self):
+
+        """Returns the page tabulated from the rows of the page only, padded to the cached widths"""
+
+        offset = 1 if self.header else 0
+        start = offset + self.page * self.page_size
+        rows = self.__table[start:start + self.page_size]
+
+        if self.header and self.__table:
+            page_str = tabulate([self.__table[0]] + rows, headers='firstrow', tablefmt='grid')
+        else:
+            page_str = tabulate(rows, tablefmt='grid')
+
+        if not page_str:
+            return page_str
+
+        lines = page_str.split('\n')
+
+        # widths of the page with the spaces around each cell, as drawn by tabulate
+        page_widths = [len(border) for border in lines[0][1:-1].split('+')]
+
+        # widths only grow, so columns do not shift when moving between pages
+        widths = [max(w, c) for w, c in zip_longest(self.__widths, page_widths, fillvalue=0)]
+        self.__widths = widths
+
+        # tabulate right aligns numbers, so their padding goes before the number
+        numeric = [_numeric(column) for column in zip_longest(*rows)] if rows else []
+        numeric += [False] * (len(page_widths) - len(numeric))
+
+        padded = []
+        for line in lines:
+            if line.startswith('+'):
+                char = line[1]
+                padded.append('+' + '+'.join(char * w for w in widths[:len(page_widths)]) + '+')
+                continue
+
+            cells = _split_cells(line, page_widths)
+            for i, cell in enumerate(cells):
+                padding = ' ' * (widths[i] - page_widths[i])
+                cells[i] = padding + cell if numeric[i] else cell + padding
+            padded.append('|' + '|'.join(cells) + '|')
+
+        return '\n'.join(padded)
+
     def __str__(self):
 
         """Returns a tabulated string"""
 
+        if self.page_size:
+            return self._page_str()
+
         if self.header:
             return tabulate(self.table, headers='firstrow', tablefmt='grid')
         else:
             return tabulate(self.table, tablefmt='grid')
+
+
+def _numeric(values):
+
+    """Returns whether tabulate would take a column of values as numbers"""
+
+    present = [v for v in values if v is not None and v != '']
+    if not present:
+        return False
+
+    for value in present:
+        if isinstance(value, bool):
+            return False
+        try:
+            float(value)
+        except (TypeError, ValueError):
+            return False
+
+    return True
+
+
+def _split_cells(line, widths):
+
+    """Splits a line of a tabulated grid into its cells, from the visible widths of the cells"""
+
+    tokens = iter(re.findall(r'\033\[[0-9;]*m|.', line[1:], flags=re.S))
+    cells = []
+
+    for width in widths:
+        cell, seen = '', 0
+        for token in tokens:
+            if seen == width and token == '|':
+                break
+            cell += token
+            seen += not token.startswith('\033')
+        cells.append(cell)
+
+    return cells
+
+
+def _visible(text):
+
+    """Removes the sequences of textformat, which take no space on the terminal"""
+
+    return re.sub(r'\033\[[0-9;]*m', '', text)
@@ -0,0 +1,145 @@
+# built-ins
+import io
+import sys
+import builtins
+from contextlib import contextmanager
+
+
+class _FrameBuffer(io.TextIOBase):
+
+    """Holds what is printed during a frame and writes it to the stream in one go when flushed"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.__parts = []
+
+    @property
+    def encoding(self):
+        return getattr(self.stream, 'encoding', 'utf-8')
+
+    def writable(self):
+        return True
+
+    def isatty(self):
+        try:
+            return self.stream.isatty()
+        except (AttributeError, ValueError):
+            return False
+
+    def write(self, s):
+        self.__parts.append(s)
+        return len(s)
+
+    def discard(self):
+        self.__parts.clear()
+
+    def flush(self):
+
+        # input() flushes stdout before reading, so a question is shown before it waits
+        if self.__parts:
+            self.stream.write(''.join(self.__parts))
+            self.__parts.clear()
+
+        self.stream.flush()
+
+
+class Renderer:
+
+    """
+    Draws the output of an Engine on the terminal
+
+    Screens are cleared by writing ANSI sequences instead of calling the shell's clear command,
+    and what a node clears and draws is buffered then written at once. The buffer is written
+    before the node executes its command or waits for an input, which both write to
+    the terminal directly, so messages printed before a long command are shown while
+    it runs and input() keeps its line editing. When stdout is not a terminal,
+    e.g. piped to a file, no sequences are written and clearing the screen does nothing.
+    """
+
+    # erase screen, erase scrollback, move cursor to the top left
+    CLEAR = '\033[2J\033[3J\033[H'
+
+    def __init__(self, stream=None):
+
+        """
+        Parameters
+        ----------
+        stream : file-like object, default=sys.stdout
+            Where the output is drawn
+        """
+
+        self.stream = stream if stream else sys.stdout
+
+        self.__frame = None
+        self.__stdout = None
+
+    @property
+    def isatty(self):
+        try:
+            return self.stream.isatty()
+        except (AttributeError, ValueError):
+            return False
+
+    @property
+    def buffering(self):
+        return self.__frame is not None and sys.stdout is self.__frame
+
+    def clear(self):
+
+        """Clears the screen"""
+
+        if not self.isatty:
+            return
+
+        if self.buffering:
+            # anything drawn before the clear in the same frame would be erased anyway
+            self.__frame.discard()
+            self.__frame.write(self.CLEAR)
+        else:
+            self.stream.write(self.CLEAR)
+            self.stream.flush()
+
+    @contextmanager
+    def frame(self):
+
+        """Buffers everything printed within the context, then writes it to the stream"""
+
+        if self.__frame:
+            yield
+            return
+
+        self.__frame = _FrameBuffer(self.stream)
+        self.__stdout = sys.stdout
+        _input = builtins.input
+
+        def _unbuffered_input(prompt=''):
+            with self.unbuffered():
+                return _input(prompt)
+
+        sys.stdout = self.__frame
+        builtins.input = _unbuffered_input
+
+        try:
+            yield
+        finally:
+            builtins.input = _input
+            sys.stdout = self.__stdout
+            self.__frame.flush()
+            self.__frame = None
+
+    @contextmanager
+    def unbuffered(self):
+
+        """Writes what is buffered, then lets everything printed within the context through"""
+
+        if not self.buffering:
+            yield
+            return
+
+        self.__frame.flush()
+        sys.stdout = self.__stdout
+
+        try:
+            yield
+        finally:
+            sys.stdout = self.__frame
@@ -1,3 +1,7 @@
+# built-ins
+from functools import lru_cache
+
+
 
 class TextEmphasis:
 
@@ -62,6 +66,82 @@ _TEXT_COLOR_PALETTE = [attr for attr in dir(TextColor) if not attr.startswith('_
 _BACKGROUND_COLOR_PALETTE = [attr for attr in dir(BackgoundColor) if not attr.startswith('__')]
 
 
+def _sequences(emphases, text_color, bg_color):
+
+    """Returns the sequences of the listed palette in the order they are applied, unknown names are ignored"""
+
+    sequences = []
+
+    for emphasis in emphases:
+        if emphasis and emphasis.upper() in _TEXT_EMPHASIS_PALETTE:
+            sequences.append(vars(TextEmphasis)[emphasis.upper()])
+    
+    if text_color and text_color.upper() in _TEXT_COLOR_PALETTE:
+        sequences.append(vars(TextColor)[text_color.upper()])
+    
+    if bg_color and bg_color.upper() in _BACKGROUND_COLOR_PALETTE:
+        sequences.append(vars(BackgoundColor)[bg_color.upper()])
+
+    return sequences
+
+
+def _cast(raw_text, sequences):
+
+    """Adds sequences one by one to text that may already have some"""
+
+    formatted = raw_text
+
+    for seq in sequences:
+        if seq not in formatted:
+            if TextEmphasis.END in formatted:
+                formatted = seq + formatted
+            else:
+                formatted =  seq + formatted + TextEmphasis.END
+
+    return formatted
+
+
+class Style:
+
+    """
+    A palette that is looked up once and can then be applied to any number of texts
+
+    Ex. header = Style(['bold', 'underline'], text_color='cyan')
+        print(header("Hideout Menu"))
+    """
+
+    def __init__(self, emphases=(None,), text_color=None, bg_color=None):
+
+        """
+        Parameters
+        ----------
+        See apply
+        """
+
+        # each sequence is put in front of the previous ones, duplicates only once
+        self.sequences = tuple(dict.fromkeys(_sequences(emphases, text_color, bg_color)))
+        self.prefix = ''.join(reversed(self.sequences))
+        self.suffix = TextEmphasis.END if self.sequences else ''
+
+    def __call__(self, raw_text):
+
+        # text that is already formatted keeps its formatting, see apply
+        if '\033' in raw_text:
+            return _cast(raw_text, self.sequences)
+
+        return self.prefix + raw_text + self.suffix
+
+
+@lru_cache(maxsize=256)
+def _style(emphases, text_color, bg_color):
+    return Style(emphases, text_color, bg_color)
+
+
+@lru_cache(maxsize=4096)
+def _apply(raw_text, emphases, text_color, bg_color):
+    return _style(emphases, text_color, bg_color)(raw_text)
+
+
 def apply(raw_text, emphases=[None], text_color=None, bg_color=None):
 
     """
@@ -82,29 +162,9 @@ def apply(raw_text, emphases=[None], text_color=None, bg_color=None):
     bg_color: str
         A color that is listed in BackgroundColor
     """
-    
-    formatted = raw_text
-    
-    # a function to add sequences to text
-    def cast(seq):
-        nonlocal formatted
-        if seq not in formatted:
-            if TextEmphasis.END in formatted:
-                formatted = seq + formatted
-            else:
-                formatted =  seq + formatted + TextEmphasis.END
-
-    for emphasis in emphases:
-        if emphasis and emphasis.upper() in _TEXT_EMPHASIS_PALETTE:
-            cast(vars(TextEmphasis)[emphasis.upper()])
-    
-    if text_color and text_color.upper() in _TEXT_COLOR_PALETTE:
-        cast(vars(TextColor)[text_color.upper()])
-    
-    if bg_color and bg_color.upper() in _BACKGROUND_COLOR_PALETTE:
-        cast(vars(BackgoundColor)[bg_color.upper()])
 
-    return formatted
+    # the same texts are formatted on every redraw, so their results are kept
+    return _apply(raw_text, tuple(emphases) if emphases else (None,), text_color, bg_color)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,130 @@
+# built-ins
+import json
+import time
+import builtins
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class Tracer:
+
+    """
+    Records where the time of an Engine run goes: executing and drawing each node, waiting for
+    the user to input and moving from one node to another. The recording can be exported as
+    a trace in Chrome's trace event format, to be opened in chrome://tracing or Perfetto.
+
+    Time spent in a nested span is not counted in its parent's time in summary(), so the
+    draw time of a Prompt does not include the time the user took to answer it.
+    """
+
+    def __init__(self):
+        self.__origin = time.perf_counter()
+        self.__events = []
+        self.__stack = []
+
+        # {node name: {kind: seconds}}
+        self.__totals = defaultdict(lambda: defaultdict(float))
+        self.__visits = defaultdict(int)
+        self.__edges = defaultdict(int)
+
+        self.__node = None
+
+    @property
+    def events(self):
+        return self.__events
+
+    @property
+    def edges(self):
+        return dict(self.__edges)
+
+    @contextmanager
+    def span(self, name, kind, **args):
+
+        """Times the code within the context as a 'node', 'execute', 'draw' or 'wait' of a node"""
+
+        if kind == 'node':
+            self.__visits[name] += 1
+            outer, self.__node = self.__node, name
+
+        # time of the spans within this one
+        nested = [0.0]
+        self.__stack.append(nested)
+        start_time = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start_time
+            self.__stack.pop()
+
+            if self.__stack:
+                self.__stack[-1][0] += duration
+
+            self.__totals[name][kind] += duration - nested[0]
+            self.__events.append({'name': name, 'cat': kind, 'ph': 'X', 'pid': 1, 'tid': 1,
+                                  'ts': (start_time - self.__origin) * 1e6, 'dur': duration * 1e6, 'args': args})
+
+            if kind == 'node':
+                self.__node = outer
+
+    def edge(self, source, target):
+
+        """Records the traversal from one node to another"""
+
+        self.__edges[(source, target)] += 1
+        self.__events.append({'name': f"{source} -> {target}", 'cat': 'traversal', 'ph': 'i', 's': 't',
+                              'pid': 1, 'tid': 1, 'ts': (time.perf_counter() - self.__origin) * 1e6,
+                              'args': {'from': source, 'to': target}})
+
+    @contextmanager
+    def waiting(self):
+
+        """Times every input() within the context as a wait of the node being run"""
+
+        _input = builtins.input
+
+        def _timed_input(prompt=''):
+            with self.span(self.__node or 'engine', 'wait'):
+                return _input(prompt)
+
+        builtins.input = _timed_input
+
+        try:
+            yield
+        finally:
+            builtins.input = _input
+
+    def summary(self):
+
+        """
+        Returns
+        -------
+        dict
+            {node name: {'visits': int, 'execute': seconds, 'draw': seconds, 'wait': seconds}}
+            sorted by the time spent in execute and draw, the longest first
+        """
+
+        summary = {name: {'visits': self.__visits[name],
+                          'execute': totals['execute'],
+                          'draw': totals['draw'],
+                          'wait': totals['wait']}
+                   for name, totals in self.__totals.items()}
+
+        return dict(sorted(summary.items(), key=lambda item: item[1]['execute'] + item[1]['draw'], reverse=True))
+
+    def export(self, filepath):
+
+        """Writes the recording to a JSON file in Chrome's trace event format"""
+
+        try:
+            with open(filepath, 'w') as f:
+                json.dump({'traceEvents': self.__events, 'displayTimeUnit': 'ms',
+                           'otherData': {'summary': self.summary(),
+                                         'edges': [{'from': s, 'to': t, 'count': c}
+                                                   for (s, t), c in self.__edges.items()]}},
+                          f, indent=1)
+
+            return True, f"Trace of {len(self.__events)} events written to {filepath}"
+
+        except Exception as e:
+            return False, f"ERROR: {str(e)}"
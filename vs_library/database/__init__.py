@@ -1,2 +1,3 @@
 from .database import *
+from .database_async import *
 from . import database_cli
@@ -1,16 +1,25 @@
 
 # built-ins
+import io
 import os
 import time
+import json
+import queue
+import hashlib
+import datetime
 import configparser
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # external packages
+import numpy
 import pandas
 import pg8000
-from pg8000.dbapi import ProgrammingError
+from pg8000.dbapi import ProgrammingError, IntegrityError, InterfaceError, DatabaseError
+from pg8000.native import to_statement
 
 from ..tools import pandas_extension
+from ..tools.progress import Progress
 
 
 @dataclass
@@ -169,11 +178,125 @@ class ConnectionManager:
         return True if self.__parser.sections() else False
 
 
+def _sql_literal(value):
+
+    """Renders a parameter value as a SQL literal, strings are quoted by doubling single quotes"""
+
+    if value is None:
+        return 'NULL'
+
+    elif isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+
+    elif isinstance(value, (int, float)):
+        return repr(value)
+
+    elif isinstance(value, (list, tuple)):
+        return f"ARRAY[{','.join(map(_sql_literal, value))}]" if value else "'{}'"
+
+    elif isinstance(value, (datetime.date, datetime.datetime)):
+        return f"'{value.isoformat()}'"
+
+    else:
+        return "'" + str(value).replace("'", "''") + "'"
+
+
+def _inline_params(statement, values=None):
+
+    """
+    Replaces the named parameters of a statement with SQL literals, 
+    for statements such as COPY that cannot take bind parameters
+    """
+
+    if not values:
+        return statement
+
+    # converts :name to $1, $2... while leaving quoted strings and casts alone
+    converted, make_args = to_statement(statement)
+    args = make_args(values)
+
+    # the converted statement is a copy of the statement except where a :name became a $n,
+    # so placeholders are found where the two differ, never within strings or dollar quotes
+    parts = []
+    i = j = 0
+
+    while i < len(statement):
+        if j < len(converted) and statement[i] == converted[j]:
+            parts.append(statement[i])
+            i += 1
+            j += 1
+            continue
+
+        # skip :name in the statement and $n in the converted statement
+        i += 2
+        while i < len(statement) and (statement[i].isalnum() or statement[i] == '_'):
+            i += 1
+
+        end = j + 1
+        while end < len(converted) and converted[end].isdigit():
+            end += 1
+
+        parts.append(_sql_literal(args[int(converted[j + 1:end]) - 1]))
+        j = end
+
+    return ''.join(parts)
+
+
+# marks NULL in COPY output so it can be told apart from empty strings
+_COPY_NULL = '\\N'
+
+# pandas dtypes of PostgreSQL type OIDs, see SELECT oid, typname FROM pg_type
+_OID_DTYPES = {
+    16: 'boolean',                          # bool
+    20: 'Int64', 21: 'Int64', 23: 'Int64',  # int8, int2, int4
+    700: 'float64', 701: 'float64',         # float4, float8
+    1700: 'float64',                        # numeric
+    25: object, 1042: object, 1043: object  # text, bpchar, varchar
+    }
+
+# date, timestamp, timestamptz
+_DATE_OIDS = (1082, 1114, 1184)
+
+
+class _CountingWriter:
+
+    """Writes bytes received from the server to a file while counting them"""
+
+    def __init__(self, f, progress=None):
+        self.__file = f
+        self.__progress = progress
+        self.bytes_written = 0
+
+    def write(self, data):
+        self.__file.write(data)
+        self.bytes_written += len(data)
+
+        if self.__progress:
+            self.__progress.update(self.bytes_written)
+
+
+class _PreparedResult:
+
+    """Holds the rows of a prepared statement behind the cursor attributes QueryTool reads"""
+
+    def __init__(self, rows, row_description):
+        self.__rows = rows
+        self.description = [(column['name'], column['type_oid'], None, None, None, None, None) 
+                            for column in row_description or []]
+        self.rowcount = len(rows)
+
+    def fetchall(self):
+        return self.__rows
+
+    def close(self):
+        self.__rows = ()
+
+
 class PostgreSQL:
 
     """A PostgreSQL connection adapter"""
 
-    def __init__(self, connection_info, paramstyle='named'):
+    def __init__(self, connection_info, paramstyle='named', prepare=False):
 
         """
         This connection adapter utilizes the pg8000 package, see here:
@@ -184,6 +307,10 @@ class PostgreSQL:
         paramstyle : 'named', 'qmark', 'numeric', 'format' or 'pyformat', default='named'
             This will depend on how query parameters are appended
             See here for more details: https://www.python.org/dev/peps/pep-0249/#paramstyle
+
+        prepare : bool, default=False
+            If True, statements with named parameters are prepared on the server once 
+            per connection and re-executed with new parameters afterwards
         """
 
         pg8000.paramstyle = paramstyle
@@ -191,6 +318,12 @@ class PostgreSQL:
         self.__connection_info = connection_info
         self.__connection = None
 
+        self.paramstyle = paramstyle
+        self.prepare = prepare
+
+        # {statement: pg8000 PreparedStatement}, only valid for the current connection
+        self.__prepared = {}
+
     @property
     def connected(self):
         return True if self.__connection else False
@@ -240,15 +373,137 @@ class PostgreSQL:
             return False, "Invalid connection info"
 
     def disconnect(self):
-        self.__connection.close()
+        self.__prepared.clear()
+
+        try:
+            self.__connection.close()
+        except Exception:
+            # the connection might already be broken
+            pass
+
         self.__connection = None
 
     def execute(self, statement, values=None):
-        """Use a database cursor to execute a SQL statement"""
+
+        """
+        Use a database cursor to execute a SQL statement, or a prepared statement
+        if prepare is True and values are named parameters
+        """
+
+        if self.prepare and isinstance(values, dict):
+            return self._execute_prepared(statement, values)
+
         cursor = self.__connection.cursor()
         cursor.execute(statement, values or {})
         return cursor
 
+    def copy_from(self, statement, stream):
+
+        """Sends data from a binary stream or an iterable of bytes through COPY ... FROM STDIN"""
+
+        cursor = self.__connection.cursor()
+        cursor.execute(statement, stream=stream)
+        cursor.close()
+
+    def copy_to(self, statement, stream, values=None, sep=',', null=''):
+
+        """
+        Streams the rows of a query as CSV with a header through COPY (...) TO STDOUT,
+        values are rendered into the statement as COPY cannot take bind parameters
+
+        Parameters
+        ----------
+        stream : binary file-like object
+            Receives the data as the server sends it
+
+        sep : str, default=','
+            Delimiter between values
+
+        null : str, default=''
+            How NULL is written, an unquoted empty value by default
+        """
+
+        copy_statement = f"COPY ({_inline_params(statement, values).strip().rstrip(';')}) " \
+                         f"TO STDOUT WITH (FORMAT csv, HEADER, DELIMITER {_sql_literal(sep)}, " \
+                         f"NULL {_sql_literal(null)})"
+
+        cursor = self.__connection.cursor()
+        cursor.execute(copy_statement, stream=stream)
+        cursor.close()
+
+    def fetch_frame(self, statement, values=None):
+
+        """
+        Fetches the rows of a query into a pandas.DataFrame without creating a Python object
+        per value. The rows are sent as CSV through COPY and parsed a whole batch at a time
+        by pandas' C parser, into NumPy arrays typed after the type of each column
+
+        Numeric columns are read as float64.
+        """
+
+        # only the type of each column is needed, no rows are returned
+        cursor = self.execute(f"SELECT * FROM ({statement.strip().rstrip(';')}) AS query LIMIT 0", values)
+        columns = [(str(d[0]), d[1]) for d in cursor.description] if cursor.description else []
+        cursor.close()
+
+        buffer = io.BytesIO()
+        self.copy_to(statement, buffer, values, null=_COPY_NULL)
+        buffer.seek(0)
+
+        dtypes = {}
+        dates = []
+
+        for position, (_, type_oid) in enumerate(columns):
+            if type_oid in _DATE_OIDS:
+                dates.append(position)
+            else:
+                dtypes[position] = _OID_DTYPES.get(type_oid, object)
+
+        df = pandas.read_csv(buffer, dtype=dtypes, parse_dates=dates, keep_default_na=False,
+                             na_values=[_COPY_NULL], true_values=['t'], false_values=['f'])
+        df.columns = [name for name, _ in columns]
+
+        return df
+
+    @property
+    def autocommit(self):
+        return self.__connection.autocommit if self.__connection else False
+
+    def commit(self):
+        self.__connection.commit()
+
+    def rollback(self):
+        self.__connection.rollback()
+
+    def _execute_prepared(self, statement, values):
+
+        """Prepares a statement on its first execution on this connection and runs it"""
+
+        prepared = self.__prepared.get(statement)
+
+        if not prepared:
+            prepared = self.__connection.prepare(statement)
+            self.__prepared[statement] = prepared
+
+        try:
+            rows = prepared.run(**values)
+
+        # raised as is by a prepared statement, converted like Cursor.execute does
+        except DatabaseError as e:
+            message = e.args[0] if e.args else None
+
+            if not isinstance(message, dict):
+                raise
+
+            if message.get('C') == '28000':
+                raise InterfaceError(message) from e
+            if message.get('C') == '23505':
+                raise IntegrityError(message) from e
+
+            raise ProgrammingError(message) from e
+
+        return _PreparedResult(rows, prepared.row_desc)
+
     def status(self):
         return True if self.__connection else False
 
@@ -258,6 +513,505 @@ class PostgreSQL:
             self.__connection.close()
 
 
+class ConnectionPool:
+
+    """
+    Holds a fixed number of PostgreSQL adapters that share the same connection info,
+    adapters are connected when they are first acquired
+
+    Attributes
+    ----------
+    size : int
+        Number of adapters, which is the most queries that can run at once
+    """
+
+    def __init__(self, connection_info, size=4, **adapter_kwargs):
+
+        """
+        Parameters
+        ----------
+        connection_info : ConnectionInfo
+            Connection info given to every adapter
+
+        size : int, default=4
+            Number of adapters in the pool
+
+        **adapter_kwargs
+            Passed to PostgreSQL, ex. prepare=True
+        """
+
+        self.size = size
+        self.__adapters = [PostgreSQL(connection_info, **adapter_kwargs) for _ in range(size)]
+        self.__available = queue.Queue()
+
+        for adapter in self.__adapters:
+            self.__available.put(adapter)
+
+    def acquire(self, timeout=None):
+
+        """Waits for an available adapter and makes sure it is connected"""
+
+        adapter = self.__available.get(timeout=timeout)
+
+        if not adapter.connected:
+            success, message = adapter.connect()
+            if not success:
+                self.__available.put(adapter)
+                raise ConnectionError(message)
+
+        return adapter
+
+    def release(self, adapter):
+        self.__available.put(adapter)
+
+    def close(self):
+
+        """Disconnects every adapter of the pool"""
+
+        for adapter in self.__adapters:
+            if adapter.connected:
+                adapter.disconnect()
+
+
+def _identifier(name):
+
+    """Quotes a (schema-qualified) name of a table or column"""
+
+    return '.'.join('"' + part.replace('"', '""') + '"' for part in str(name).split('.'))
+
+
+def _whole_numbers(df):
+
+    """
+    Casts float columns holding only whole numbers to nullable integers, as pandas reads
+    an integer column with blanks as float64 which would be written as 1.0, 2.0...
+    and rejected by COPY into an integer column
+    """
+
+    casts = {}
+
+    for column in df.select_dtypes(include='float').columns:
+        values = df[column].dropna()
+        # floats are only exact integers up to 2 ** 53
+        if (values.abs() < 2 ** 53).all() and (values == numpy.floor(values)).all():
+            casts[column] = 'Int64'
+
+    return df.astype(casts) if casts else df
+
+
+class BulkLoader:
+
+    """
+    Loads a pandas.DataFrame into a table through a staging table filled by COPY FROM STDIN,
+    rows are then inserted or upserted from the staging table in a single statement
+
+    Attributes
+    ----------
+    table : str
+        Name of the table to load into, can be schema-qualified
+
+    columns : dict
+        {dataframe column: table column}, only these columns are loaded
+
+    column_types : dict
+        {table column: SQL type} of the staging table, columns not given take their type
+        from the table. Values are sent as text and parsed by the server into these types
+    """
+
+    def __init__(self, connection_adapter, table, columns=None, column_types=None):
+
+        """
+        Parameters
+        ----------
+        connection_adapter : PostgreSQL
+            Adapter of the database where the table is
+
+        table : str
+            Name of the table to load into
+
+        columns : list or dict, optional
+            Dataframe columns to load, a dict also renames them to the table's columns.
+            Every column of the first chunk is loaded if not given
+
+        column_types : dict, optional
+            Types of the staging table's columns
+        """
+
+        self.connection_adapter = connection_adapter
+        self.table = table
+        self.columns = dict(zip(columns, columns)) if isinstance(columns, (list, tuple)) else columns
+        self.column_types = column_types if column_types else dict()
+
+        self.__rows = 0
+        self.__time_taken = 0
+
+    @property
+    def load_message(self):
+        return f"{self.__rows} rows loaded into {self.table} in {round(self.__time_taken, 2)}s " \
+               f"({round(self.__rows / self.__time_taken) if self.__time_taken else self.__rows} rows/s)"
+
+    def load(self, df, chunksize=100000, upsert_on=None, progress=None):
+
+        """
+        Streams rows into the staging table and moves them to the table, all in one transaction
+
+        Blank values and NaN are loaded as NULL.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame or iterable of pandas.DataFrame
+            Rows to be loaded, chunks must share the same columns
+
+        chunksize : int, default=100000
+            Rows of a DataFrame sent in each COPY
+
+        upsert_on : list, optional
+            Table columns of a unique constraint, rows that conflict on them are updated
+
+        progress : function, optional
+            Takes a ProgressUpdate, see vs_library.tools.progress.Progress,
+            reported as each chunk is sent
+
+        Returns
+        -------
+        (bool, str)
+        """
+
+        chunks = (df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize)) \
+                 if isinstance(df, pandas.DataFrame) else df
+
+        staging = f"{self.table.split('.')[-1]}_staging"
+        self.__rows = 0
+
+        reporter = Progress(progress, 'Loading', total=len(df) if isinstance(df, pandas.DataFrame) else 0) \
+                   if progress else None
+
+        start_time = time.perf_counter()
+
+        try:
+            if not self.connection_adapter.connected:
+                success, message = self.connection_adapter.connect()
+                if not success:
+                    return False, message
+
+            columns = None
+
+            for chunk in chunks:
+                if columns is None:
+                    columns = self.columns if self.columns else dict(zip(chunk.columns, chunk.columns))
+                    self._create_staging(staging, columns.values())
+
+                buffer = io.BytesIO()
+                _whole_numbers(chunk[list(columns.keys())]).to_csv(buffer, header=False, index=False)
+                buffer.seek(0)
+
+                self.connection_adapter.copy_from(
+                    f"COPY {_identifier(staging)} ({', '.join(map(_identifier, columns.values()))}) "
+                    f"FROM STDIN WITH (FORMAT csv)", buffer)
+
+                self.__rows += len(chunk)
+
+                if reporter:
+                    reporter.update(self.__rows)
+
+            if columns is None:
+                return False, "No data was given to be loaded"
+
+            if reporter:
+                reporter.finish(self.__rows)
+                reporter.start('Inserting', total=self.__rows)
+
+            self.connection_adapter.execute(self._insert_statement(staging, columns.values(), upsert_on)).close()
+            self.connection_adapter.execute(f"DROP TABLE {_identifier(staging)}").close()
+
+            if not self.connection_adapter.autocommit:
+                self.connection_adapter.commit()
+
+            self.__time_taken = time.perf_counter() - start_time
+
+            if reporter:
+                reporter.finish()
+
+            return True, self.load_message
+
+        except Exception as e:
+            self.__rows = 0
+            self.__time_taken = time.perf_counter() - start_time
+
+            try:
+                self.connection_adapter.rollback()
+            except Exception:
+                self.connection_adapter.disconnect()
+
+            return False, _error_message(e)
+
+    def _create_staging(self, staging, table_columns):
+
+        """Creates a temporary table with the loaded columns, typed like the table unless given"""
+
+        self.connection_adapter.execute(f"DROP TABLE IF EXISTS {_identifier(staging)}").close()
+        self.connection_adapter.execute(
+            f"CREATE TEMP TABLE {_identifier(staging)} AS "
+            f"SELECT {', '.join(map(_identifier, table_columns))} FROM {_identifier(self.table)} "
+            f"WITH NO DATA").close()
+
+        # the staging table is empty, so its columns can change type without converting values
+        for column, column_type in self.column_types.items():
+            if column in table_columns:
+                self.connection_adapter.execute(
+                    f"ALTER TABLE {_identifier(staging)} ALTER COLUMN {_identifier(column)} "
+                    f"TYPE {column_type} USING NULL").close()
+
+    def _insert_statement(self, staging, table_columns, upsert_on=None):
+        columns = ', '.join(map(_identifier, table_columns))
+
+        statement = f"INSERT INTO {_identifier(self.table)} ({columns}) " \
+                    f"SELECT {columns} FROM {_identifier(staging)}"
+
+        if upsert_on:
+            updates = [f"{_identifier(c)} = EXCLUDED.{_identifier(c)}" for c in table_columns 
+                       if c not in upsert_on]
+
+            statement += f" ON CONFLICT ({', '.join(map(_identifier, upsert_on))}) " + \
+                         (f"DO UPDATE SET {', '.join(updates)}" if updates else "DO NOTHING")
+
+        return statement
+
+
+class IncrementalQuery:
+
+    """
+    Keeps the results of a query in a local parquet file along with a watermark, such as 
+    the most recent status date, so that later runs only fetch rows from the watermark on 
+    and merge them into the stored rows by key
+
+    Rows deleted on the database are not removed from the stored rows, 
+    use refresh=True to pull the full results again.
+
+    Attributes
+    ----------
+    rows_fetched : int
+        Rows returned by the database on the last run
+
+    rows_reused : int
+        Stored rows that were kept without being fetched on the last run
+    """
+
+    def __init__(self, query_tool, filepath, key='candidate_id'):
+
+        """
+        Parameters
+        ----------
+        query_tool : QueryTool
+            Holds the merged rows as its results after each run
+
+        filepath : str
+            Path of the parquet file, the watermark is kept next to it as a .json file
+
+        key : str, default='candidate_id'
+            Column that identifies a row
+        """
+
+        self.query_tool = query_tool
+        self.filepath = filepath
+        self.key = key
+
+        self.rows_fetched = 0
+        self.rows_reused = 0
+
+    @property
+    def metadata_filepath(self):
+        return os.path.splitext(self.filepath)[0] + '.json'
+
+    @staticmethod
+    def _fingerprint(query):
+        statement, params = query
+        return hashlib.sha256((statement + json.dumps(params, sort_keys=True, default=str)).encode()).hexdigest()
+
+    def _read_metadata(self):
+        try:
+            with open(self.metadata_filepath) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def run(self, query, delta_query, watermark_query, refresh=False):
+
+        """
+        Fetches the rows from the stored watermark on, or every row if nothing is stored for the query
+
+        Parameters
+        ----------
+        query : (statement, params)
+            Full query, ex. Incumbents(...).by_congstatus()
+
+        delta_query : function
+            Returns the query restricted to rows from a watermark on, 
+            ex. Incumbents(...).by_congstatus_since
+
+        watermark_query : str
+            Statement that returns the current watermark as a single value,
+            ex. Incumbents.congstatus_watermark_statement
+
+        refresh : bool, default=False
+            If True, the stored rows are ignored and every row is fetched
+        """
+
+        start_time = time.perf_counter()
+        fingerprint = self._fingerprint(query)
+        metadata = self._read_metadata()
+
+        cached = None
+        if not refresh and metadata.get('fingerprint') == fingerprint and \
+           metadata.get('watermark') is not None and os.path.exists(self.filepath):
+            cached, message = pandas_extension.read_spreadsheet(self.filepath)
+
+            # an unreadable file is read as an empty DataFrame, every row is fetched again instead
+            if message.startswith('ERROR'):
+                cached = None
+
+        # the watermark is taken before fetching, the delta query fetches rows from the watermark
+        # onward so rows of the same date added after it was taken are fetched on the next run
+        watermark_tool = QueryTool(self.query_tool.connection_adapter)
+        watermark_tool.query = (watermark_query, )
+        success, message = watermark_tool.run()
+
+        if not success:
+            return False, message
+
+        watermark = next(iter(watermark_tool.results()[0]), (None, ))[0]
+
+        self.query_tool.query = delta_query(metadata['watermark']) if cached is not None else query
+        success, message = self.query_tool.run()
+
+        if not success:
+            return False, message
+
+        fetched = self.query_tool.results(as_format='pandas_df')
+        self.rows_fetched = len(fetched)
+
+        if cached is not None and not cached.empty:
+            kept = cached[~cached[self.key].isin(fetched[self.key])]
+            self.rows_reused = len(kept)
+            merged = pandas.concat([kept, fetched], ignore_index=True).sort_values(self.key, ignore_index=True)
+        else:
+            self.rows_reused = 0
+            merged = fetched
+
+        success, message = pandas_extension.to_spreadsheet(merged, self.filepath)
+
+        if not success:
+            return False, message
+
+        with open(self.metadata_filepath, 'w') as f:
+            json.dump({'fingerprint': fingerprint, 
+                       'watermark': watermark.isoformat() if hasattr(watermark, 'isoformat') else watermark,
+                       'refreshed_at': datetime.datetime.now().isoformat()}, f)
+
+        self.query_tool.set_results(merged, time_taken=time.perf_counter() - start_time)
+
+        return True, f"{self.rows_fetched} rows fetched, {self.rows_reused} rows reused."
+
+
+@dataclass
+class QueryResult:
+
+    """
+    Outcome of a single query in a batch
+
+    Attributes
+    ----------
+    success : bool
+        False if the query raised an error
+
+    message : str
+        Success or error message of the query
+    
+    rows : list
+        Rows returned by the query
+
+    header : list
+        Column names of the rows
+
+    time_taken : float
+        Seconds from sending the query to fetching all of its rows
+    """
+
+    success: bool = False
+    message: str = ''
+    rows: list = field(default_factory=list, repr=False)
+    header: list = field(default_factory=list)
+    time_taken: float = 0
+
+
+def _error_message(e):
+
+    """Formats an error raised while querying into a message"""
+
+    if isinstance(e, ProgrammingError):
+        # ProgrammingError returns a dict-like string
+        error_dict = eval(str(e))
+        return f"ERROR: {error_dict['M']}.{' ' + error_dict['H'] if 'H' in error_dict.keys() else ''}"
+
+    return f"ERROR: {str(e)}"
+
+
+# row estimates this many times larger or smaller than the actual rows are flagged
+PLAN_ESTIMATE_RATIO = 10
+
+
+def _plan_warnings(node, warnings=None):
+
+    """Walks an EXPLAIN (FORMAT JSON) plan for sequential scans and bad row estimates"""
+
+    warnings = [] if warnings is None else warnings
+
+    if node.get('Node Type') == 'Seq Scan':
+        warnings.append(f"Sequential scan on {node.get('Relation Name')} "
+                        f"({node.get('Actual Rows', 0) * node.get('Actual Loops', 1)} rows)")
+
+    if 'Actual Rows' in node and node.get('Actual Loops', 1):
+        estimated, actual = max(node['Plan Rows'], 1), max(node['Actual Rows'], 1)
+
+        if max(estimated / actual, actual / estimated) > PLAN_ESTIMATE_RATIO:
+            warnings.append(f"{node['Node Type']}{' on ' + node['Relation Name'] if 'Relation Name' in node else ''} "
+                            f"estimated {node['Plan Rows']} rows, actual {node['Actual Rows']} rows")
+
+    for child in node.get('Plans', []):
+        _plan_warnings(child, warnings)
+
+    return warnings
+
+
+def _format_results(results, as_format):
+
+    """Formats (rows, header) into 'tuple', 'records' or 'pandas_df', see QueryTool.results"""
+
+    # results fetched as arrays are already a DataFrame
+    if isinstance(results, pandas.DataFrame):
+        if as_format == 'pandas_df':
+            return results
+
+        # NumPy scalars and missing values are turned back into Python objects
+        values = results.astype(object).where(results.notna(), None)
+        results = (list(values.itertuples(index=False, name=None)), [str(c) for c in results.columns])
+
+    if as_format == 'tuple':
+        return results if results else ()
+
+    elif as_format == 'records':
+        rows, header = results if results else ([], [])
+        return {index:dict(zip(header, row)) for index, row in enumerate(rows)}
+
+    elif as_format == 'pandas_df':
+        rows, header = results if results else ([], [])
+
+        return pandas.DataFrame(list(rows), columns=header)
+
+    else:
+        return None
+
+
 class QueryTool:
 
     """Perform SQL querying on database and stores query results
@@ -269,17 +1023,31 @@ class QueryTool:
         The second element in the tuple are the parameters of the query string
     """
 
-    def __init__(self, connection_adapter):
+    def __init__(self, connection_adapter, profile=False, slow_query_log=None, slow_query_threshold=1.0):
 
         """
         Parameters
         ----------
         connection_adapter : (PostgreSQL or other)
             An extension of a database adapter
+
+        profile : bool, default=False
+            If True, each successful run is followed by EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)
+            of the same query, which executes the query a second time
+
+        slow_query_log : str, optional
+            Path of a JSON lines file where runs that take slow_query_threshold or longer are recorded
+
+        slow_query_threshold : float, default=1.0
+            Seconds a run has to take to be recorded in slow_query_log
         """
 
         self.connection_adapter = connection_adapter
 
+        self.profile = profile
+        self.slow_query_log = slow_query_log
+        self.slow_query_threshold = slow_query_threshold
+
         self.__query_statement = None
         self.__query_params = None
 
@@ -289,6 +1057,12 @@ class QueryTool:
         self.__number_of_columns = 0
         self.__time_taken = 0
 
+        # {key: QueryResult} of the last batch
+        self.__batch = {}
+
+        # {'plan': ..., 'warnings': [...]} of the last profiled run
+        self.__plan = None
+
     @property
     def query(self):
         return self.__query_statement, self.__query_params
@@ -316,20 +1090,17 @@ class QueryTool:
         -------
         tuple, [dict_1, dict_2...] or pandas.DataFrame()
         """
-        if as_format == 'tuple':
-            return self.__results if self.__results else ()
 
-        elif as_format == 'records':
-            rows, header = self.__results if self.__results else ([], [])
-            return {index:dict(zip(header, row)) for index, row in enumerate(rows)}
+        return _format_results(self.__results, as_format)
 
-        elif as_format == 'pandas_df':
-            rows, header = self.__results if self.__results else ([], [])
+    def set_results(self, df, time_taken=0):
 
-            return pandas.DataFrame(list(rows), columns=header)
+        """Replaces the query results with the rows of a pandas.DataFrame"""
 
-        else:
-            return None
+        self.__results = (list(df.itertuples(index=False, name=None)), [str(c) for c in df.columns])
+        self.__number_of_rows = len(df)
+        self.__number_of_columns = len(df.columns)
+        self.__time_taken = time_taken
 
     @property
     def query_message(self):
@@ -337,12 +1108,28 @@ class QueryTool:
                f"{self.__number_of_columns} columns.\n" \
                f"Time taken: {self.__time_taken}s"
 
-    def run(self):
+    def run(self, decode='python', progress=None):
 
-        """Excecutes query statement using a database cursor"""
+        """
+        Excecutes query statement using a database cursor
+
+        Parameters
+        ----------
+        decode : 'python' or 'numpy', default='python'
+            'python' fetches rows as tuples of Python objects
+            'numpy' fetches columns as NumPy arrays through PostgreSQL.fetch_frame,
+            which is faster for wide or long results that end up in a pandas.DataFrame
+
+        progress : function, optional
+            Takes a ProgressUpdate, see vs_library.tools.progress.Progress. Rows arrive all
+            at once, so the 'Querying' phase is reported when it starts and when it finishes
+        """
 
         # calculates the total time taken to execute query
-        start_time = time.process_time()
+        start_time = time.perf_counter()
+        self.__plan = None
+
+        reporter = Progress(progress, 'Querying') if progress else None
 
         try:
             # make sure connection is established
@@ -351,24 +1138,41 @@ class QueryTool:
                 if not success:
                     return False, message
             
-            cursor = self.connection_adapter.execute(self.__query_statement, self.__query_params)
-            end_time = time.process_time()
+            if decode == 'numpy':
+                df = self.connection_adapter.fetch_frame(self.__query_statement, self.__query_params)
 
-            header = [str(k[0]) for k in cursor.description]
-            # fetchall will empty cursor contents, list to store it somewhere else
-            rows = list(cursor.fetchall()) if cursor else [] 
+                self.__results = df
+                self.__number_of_columns = len(df.columns)
+                self.__number_of_rows = len(df)
+                self.__time_taken = time.perf_counter() - start_time
 
-            self.__results = (rows, header)
-            self.__number_of_columns = len(header)
-            self.__number_of_rows = cursor.rowcount
-            self.__time_taken = end_time - start_time
+            else:
+                cursor = self.connection_adapter.execute(self.__query_statement, self.__query_params)
+                end_time = time.perf_counter()
 
-            cursor.close()
+                header = [str(k[0]) for k in cursor.description]
+                # fetchall will empty cursor contents, list to store it somewhere else
+                rows = list(cursor.fetchall()) if cursor else [] 
+
+                self.__results = (rows, header)
+                self.__number_of_columns = len(header)
+                self.__number_of_rows = cursor.rowcount
+                self.__time_taken = end_time - start_time
+
+                cursor.close()
+
+            if reporter:
+                reporter.finish(self.__number_of_rows)
+
+            if self.profile:
+                self.explain()
+
+            self._log_slow_query(True)
 
             return True, "Successfully executed query."
         
         except ProgrammingError as e:
-            end_time = time.process_time()
+            end_time = time.perf_counter()
 
             # ProgrammingError returns a dict-like string
             error_dict = eval(str(e))
@@ -382,11 +1186,13 @@ class QueryTool:
             if self.connection_adapter.connected:
                 self.connection_adapter.disconnect()
 
+            self._log_slow_query(False)
+
             return False, f"ERROR: {error_dict['M']}.{' ' + error_dict['H'] if 'H' in error_dict.keys() else ''}"
 
         except Exception as e:
 
-            end_time = time.process_time()
+            end_time = time.perf_counter()
 
             self.__results = None
             self.__number_of_rows = 0
@@ -397,15 +1203,324 @@ class QueryTool:
             if self.connection_adapter.connected:
                 self.connection_adapter.disconnect()
 
+            self._log_slow_query(False)
+
             return False, f"ERROR: {str(e)}"
+
+    @property
+    def plan(self):
+        return self.__plan
+
+    def explain(self):
+
+        """
+        Captures the execution plan of the query with EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)
+        and flags sequential scans and row estimates that are off by more than PLAN_ESTIMATE_RATIO
+
+        Returns
+        -------
+        (bool, str)
+        """
+
+        try:
+            # parameters are rendered into the statement, so the plan is the one of these values
+            cursor = self.connection_adapter.execute(
+                f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {_inline_params(self.__query_statement, self.__query_params)}")
+            output = next(iter(cursor.fetchall()))[0]
+            cursor.close()
+
+            if not self.connection_adapter.autocommit:
+                self.connection_adapter.rollback()
+
+            plan = json.loads(output) if isinstance(output, str) else output
+            self.__plan = {'plan': plan, 'warnings': _plan_warnings(plan[0]['Plan'])}
+
+            return True, '\n'.join(self.__plan['warnings']) if self.__plan['warnings'] else "No plan warnings."
+
+        except Exception as e:
+            try:
+                self.connection_adapter.rollback()
+            except Exception:
+                pass
+
+            return False, _error_message(e)
+
+    def _log_slow_query(self, success):
+
+        """Appends the last run to slow_query_log if it took slow_query_threshold or longer"""
+
+        if not self.slow_query_log or self.__time_taken < self.slow_query_threshold:
+            return
+
+        record = {'timestamp': datetime.datetime.now().isoformat(),
+                  'statement_hash': hashlib.sha256(str(self.__query_statement).encode()).hexdigest()[:16],
+                  'params': self.__query_params,
+                  'duration': round(self.__time_taken, 4),
+                  'rows': self.__number_of_rows,
+                  'success': success}
+
+        if self.__plan:
+            record['plan_warnings'] = self.__plan['warnings']
+            record['planning_time'] = self.__plan['plan'][0].get('Planning Time')
+            record['execution_time'] = self.__plan['plan'][0].get('Execution Time')
+
+        try:
+            with open(self.slow_query_log, 'a') as f:
+                f.write(json.dumps(record, default=str) + '\n')
+        except OSError:
+            # logging should never fail a query
+            pass
     
-    def export(self, filepath):
+    @property
+    def batch(self):
+        return self.__batch
+
+    def batch_results(self, as_format='tuple'):
+
+        """
+        Returns the results of every successful query in the last batch
+
+        Returns
+        -------
+        {key: tuple, [dict_1, dict_2...] or pandas.DataFrame()}
+        """
+
+        return {key: _format_results((result.rows, result.header), as_format) 
+                for key, result in self.__batch.items() if result.success}
+
+    def run_batch(self, queries, pool=None, progress=None):
+
+        """
+        Executes several queries, concurrently if a pool is given. Each query runs in its own
+        transaction, so a failed query is rolled back and recorded without stopping the batch
+
+        Parameters
+        ----------
+        queries : list or dict
+            (statement, params) tuples, results are keyed by their index in a list 
+            or by their key in a dict
+
+        pool : ConnectionPool, optional
+            Queries are distributed over the adapters of the pool, 
+            otherwise they run one after another on connection_adapter
+
+        progress : function, optional
+            Takes a ProgressUpdate, see vs_library.tools.progress.Progress,
+            reported as each query completes
+
+        Returns
+        -------
+        (bool, str)
+            True if every query succeeds
+        """
+
+        queries = dict(queries) if isinstance(queries, dict) else dict(enumerate(queries))
+        self.__batch = {}
+
+        reporter = Progress(progress, 'Querying', total=len(queries), unit='queries') if progress else None
+
+        start_time = time.perf_counter()
+
+        if pool:
+            def _pooled(query):
+                try:
+                    adapter = pool.acquire()
+                except Exception as e:
+                    return QueryResult(success=False, message=_error_message(e))
+
+                try:
+                    return self._run_isolated(adapter, query)
+                finally:
+                    pool.release(adapter)
+
+            with ThreadPoolExecutor(max_workers=pool.size) as executor:
+                futures = {key: executor.submit(_pooled, query) for key, query in queries.items()}
+
+                if reporter:
+                    for _ in as_completed(futures.values()):
+                        reporter.advance()
+
+                self.__batch = {key: future.result() for key, future in futures.items()}
+
+        else:
+            if not self.connection_adapter.connected:
+                success, message = self.connection_adapter.connect()
+                if not success:
+                    return False, message
+
+            for key, query in queries.items():
+                self.__batch[key] = self._run_isolated(self.connection_adapter, query)
+
+                if reporter:
+                    reporter.advance()
+
+        if reporter:
+            reporter.finish()
+
+        failed = [key for key, result in self.__batch.items() if not result.success]
+
+        message = f"{len(queries) - len(failed)} of {len(queries)} queries succeeded " \
+                  f"in {round(time.perf_counter() - start_time, 2)}s."
+
+        if failed:
+            message += f" Failed: {', '.join(map(str, failed))}"
+
+        return not failed, message
+
+    def run_partitioned(self, queries, pool=None, distinct_on='candidate_id'):
+
+        """
+        Executes partitions of a query concurrently and combines their rows as the results 
+        of this tool, see vs_library.vsdb.queries.partition
+
+        Parameters
+        ----------
+        queries : list
+            (statement, params) tuples that only differ in their parameters
+
+        pool : ConnectionPool, optional
+            Its size is the degree of parallelism
+
+        distinct_on : str, default='candidate_id'
+            Column that is unique in the combined rows, the first row of each value is kept 
+            and rows are sorted by it, as a DISTINCT ON over the whole query would
+        """
+
+        # wall-clock time, partitions run at the same time on a pool
+        start_time = time.perf_counter()
+        success, message = self.run_batch(queries, pool=pool)
+
+        if not success:
+            self.__results = None
+            self.__number_of_rows = 0
+            self.__number_of_columns = 0
+            self.__time_taken = time.perf_counter() - start_time
+            return False, message
+
+        header = next(iter(self.__batch.values())).header if self.__batch else []
+        rows = [row for key in sorted(self.__batch) for row in self.__batch[key].rows]
+
+        if distinct_on and distinct_on in header:
+            position = header.index(distinct_on)
+            unique = {}
+            for row in rows:
+                unique.setdefault(row[position], row)
+            rows = [unique[k] for k in sorted(unique)]
+
+        self.__results = (rows, header)
+        self.__number_of_rows = len(rows)
+        self.__number_of_columns = len(header)
+        self.__time_taken = time.perf_counter() - start_time
+
+        return True, message
+
+    @staticmethod
+    def _run_isolated(adapter, query):
+
+        """Runs a single query and rolls back its transaction if it fails"""
+
+        statement, *params = query
+        start_time = time.perf_counter()
+
+        # a previous query might have broken the connection
+        if not adapter.connected:
+            success, message = adapter.connect()
+            if not success:
+                return QueryResult(success=False, message=message)
+
+        try:
+            cursor = adapter.execute(statement, next(iter(params)) if params else None)
+            header = [str(k[0]) for k in cursor.description] if cursor.description else []
+            rows = list(cursor.fetchall())
+            cursor.close()
+
+            if not adapter.autocommit:
+                adapter.commit()
+
+            return QueryResult(success=True, message="Successfully executed query.", rows=rows, 
+                               header=header, time_taken=time.perf_counter() - start_time)
+
+        except Exception as e:
+            try:
+                adapter.rollback()
+            except Exception:
+                # the connection itself is broken, it is reconnected on its next use
+                adapter.disconnect()
+
+            return QueryResult(success=False, message=_error_message(e), 
+                               time_taken=time.perf_counter() - start_time)
+
+    def export(self, filepath, copy=False, progress=None):
+
+        """
+        Exports the query results to a spreadsheet file
+
+        Parameters
+        ----------
+        filepath : str
+            Path on a user's computer where results are to be exported
+
+        copy : bool, default=False
+            If True, the query is executed again through COPY and the server's output 
+            is written straight to the file, only for .csv and .tsv files
+
+        progress : function, optional
+            Takes a ProgressUpdate, see vs_library.tools.progress.Progress,
+            counted in bytes with copy and in rows otherwise
+        """
+
+        if copy:
+            return self._copy_export(filepath, progress)
 
         try:
             df = self.results(as_format='pandas_df')
-            success, message = pandas_extension.to_spreadsheet(df, filepath=filepath)
+            success, message = pandas_extension.to_spreadsheet(df, filepath=filepath, progress=progress)
             
             return success, message
             
         except Exception as e:
             return False, f"ERROR: {str(e)}"
+
+    def _copy_export(self, filepath, progress=None):
+
+        """Writes the output of COPY to a file without converting any values on the client"""
+
+        _ , ext = os.path.splitext(filepath)
+
+        if ext not in ('.csv', '.tsv'):
+            return False, f"File not exported. Extension: \'{ext}\' is not supported by COPY"
+
+        try:
+            if not self.connection_adapter.connected:
+                success, message = self.connection_adapter.connect()
+                if not success:
+                    return False, message
+
+            start_time = time.perf_counter()
+            reporter = Progress(progress, 'Exporting', unit='bytes') if progress else None
+
+            with open(filepath, 'wb', buffering=io.DEFAULT_BUFFER_SIZE * 128) as f:
+                writer = _CountingWriter(f, reporter)
+                self.connection_adapter.copy_to(self.__query_statement, writer, self.__query_params,
+                                                sep='\t' if ext == '.tsv' else ',')
+
+            if reporter:
+                reporter.finish(writer.bytes_written)
+
+            if not self.connection_adapter.autocommit:
+                self.connection_adapter.commit()
+
+            seconds = time.perf_counter() - start_time
+            megabytes = writer.bytes_written / 1024 ** 2
+
+            return True, f"File successfully exported to \'{os.path.abspath(filepath)}\'\n" \
+                         f"{writer.bytes_written} bytes written in {round(seconds, 2)}s " \
+                         f"({round(megabytes / seconds, 2) if seconds else megabytes} MB/s)"
+
+        except Exception as e:
+            try:
+                self.connection_adapter.rollback()
+            except Exception:
+                self.connection_adapter.disconnect()
+
+            return False, _error_message(e)
@@ -0,0 +1,272 @@
+# built-ins
+import time
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+# internal packages
+from .database import PostgreSQL, QueryResult, _error_message, _format_results
+
+
+class AsyncPostgreSQL:
+
+    """
+    An awaitable PostgreSQL connection adapter
+
+    pg8000 is a blocking driver, so each call is handed to a worker thread while the
+    event loop carries on with other queries. Statements on the same adapter are run
+    one at a time, as a connection can only serve one statement at once.
+    """
+
+    def __init__(self, connection_info, paramstyle='named', prepare=False, executor=None):
+
+        """
+        Parameters
+        ----------
+        connection_info, paramstyle, prepare
+            See PostgreSQL
+
+        executor : concurrent.futures.ThreadPoolExecutor, optional
+            Where calls are run, the event loop's default executor if not given
+        """
+
+        self.__adapter = PostgreSQL(connection_info, paramstyle=paramstyle, prepare=prepare)
+        self.__lock = asyncio.Lock()
+        self.__executor = executor
+
+    @property
+    def connected(self):
+        return self.__adapter.connected
+
+    @property
+    def connection_info(self):
+        return self.__adapter.connection_info
+
+    @connection_info.setter
+    def connection_info(self, c):
+        self.__adapter.connection_info = c
+
+    @property
+    def autocommit(self):
+        return self.__adapter.autocommit
+
+    @property
+    def paramstyle(self):
+        return self.__adapter.paramstyle
+
+    @property
+    def prepare(self):
+        return self.__adapter.prepare
+
+    async def _call(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.__executor, functools.partial(function, *args))
+
+    async def connect(self, autocommit=False):
+        async with self.__lock:
+            return await self._call(self.__adapter.connect, autocommit)
+
+    async def disconnect(self):
+        async with self.__lock:
+            await self._call(self.__adapter.disconnect)
+
+    async def execute(self, statement, values=None):
+
+        """Executes a SQL statement, rows are fetched before the cursor is returned"""
+
+        async with self.__lock:
+            return await self._call(self.__adapter.execute, statement, values)
+
+    async def commit(self):
+        async with self.__lock:
+            await self._call(self.__adapter.commit)
+
+    async def rollback(self):
+        async with self.__lock:
+            await self._call(self.__adapter.rollback)
+
+
+class AsyncQueryTool:
+
+    """Perform SQL querying on database and stores query results, with awaitable execution
+
+    Attributes
+    ----------
+    query : tuple
+        The first element in the tuple is the query string
+        The second element in the tuple are the parameters of the query string
+    """
+
+    def __init__(self, connection_adapter):
+
+        """
+        Parameters
+        ----------
+        connection_adapter : AsyncPostgreSQL
+            An awaitable database adapter
+        """
+
+        self.connection_adapter = connection_adapter
+
+        self.__query_statement = None
+        self.__query_params = None
+
+        self.__results = None
+
+        self.__number_of_rows = 0
+        self.__number_of_columns = 0
+        self.__time_taken = 0
+
+        # {key: QueryResult} of the last gather
+        self.__batch = {}
+
+    @property
+    def query(self):
+        return self.__query_statement, self.__query_params
+
+    @query.setter
+    def query(self, query):
+        statement, *params = query
+
+        self.__query_statement = statement if statement else None
+        self.__query_params = next(iter(params)) if params else None
+
+    def results(self, as_format='tuple'):
+
+        """Returns query results in a specific format, see QueryTool.results"""
+
+        return _format_results(self.__results, as_format)
+
+    @property
+    def query_message(self):
+        return f"Query returns {self.__number_of_rows} rows, " \
+               f"{self.__number_of_columns} columns.\n" \
+               f"Time taken: {self.__time_taken}s"
+
+    async def run(self):
+
+        """Excecutes query statement without blocking the event loop"""
+
+        result = await _run_isolated(self.connection_adapter, (self.__query_statement, self.__query_params))
+
+        self.__results = (result.rows, result.header) if result.success else None
+        self.__number_of_rows = len(result.rows)
+        self.__number_of_columns = len(result.header)
+        self.__time_taken = result.time_taken
+
+        # error can be due to a connection error
+        if not result.success and self.connection_adapter.connected:
+            await self.connection_adapter.disconnect()
+
+        return result.success, result.message
+
+    @property
+    def batch(self):
+        return self.__batch
+
+    def batch_results(self, as_format='tuple'):
+
+        """Returns the results of every successful query in the last gather, see QueryTool.batch_results"""
+
+        return {key: _format_results((result.rows, result.header), as_format)
+                for key, result in self.__batch.items() if result.success}
+
+    async def gather(self, queries, limit=4):
+
+        """
+        Executes several queries at once, each query runs in its own transaction so a
+        failed query is recorded without stopping the others
+
+        Parameters
+        ----------
+        queries : list or dict
+            (statement, params) tuples, results are keyed by their index in a list
+            or by their key in a dict
+
+        limit : int, default=4
+            Most queries that run at the same time, each one on its own connection
+            opened with connection_adapter's connection info, paramstyle and prepare,
+            and its own thread so the default executor's size is not a limit
+
+        Returns
+        -------
+        (bool, str)
+            True if every query succeeds
+        """
+
+        queries = dict(queries) if isinstance(queries, dict) else dict(enumerate(queries))
+
+        workers = max(min(limit, len(queries)), 1)
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+        adapters = asyncio.Queue()
+        for _ in range(workers):
+            adapters.put_nowait(AsyncPostgreSQL(self.connection_adapter.connection_info,
+                                                paramstyle=self.connection_adapter.paramstyle,
+                                                prepare=self.connection_adapter.prepare,
+                                                executor=executor))
+
+        async def _limited(query):
+            adapter = await adapters.get()
+            try:
+                return await _run_isolated(adapter, query)
+            finally:
+                adapters.put_nowait(adapter)
+
+        start_time = time.perf_counter()
+
+        try:
+            results = await asyncio.gather(*(_limited(query) for query in queries.values()))
+            self.__batch = dict(zip(queries.keys(), results))
+
+        finally:
+            while not adapters.empty():
+                adapter = adapters.get_nowait()
+                if adapter.connected:
+                    await adapter.disconnect()
+
+            executor.shutdown(wait=False)
+
+        failed = [key for key, result in self.__batch.items() if not result.success]
+
+        message = f"{len(queries) - len(failed)} of {len(queries)} queries succeeded " \
+                  f"in {round(time.perf_counter() - start_time, 2)}s."
+
+        if failed:
+            message += f" Failed: {', '.join(map(str, failed))}"
+
+        return not failed, message
+
+
+async def _run_isolated(adapter, query):
+
+    """Runs a single query on an AsyncPostgreSQL and rolls back its transaction if it fails"""
+
+    statement, *params = query
+    start_time = time.perf_counter()
+
+    if not adapter.connected:
+        success, message = await adapter.connect()
+        if not success:
+            return QueryResult(success=False, message=message)
+
+    try:
+        cursor = await adapter.execute(statement, next(iter(params)) if params else None)
+        header = [str(k[0]) for k in cursor.description] if cursor.description else []
+        rows = list(cursor.fetchall())
+        cursor.close()
+
+        if not adapter.autocommit:
+            await adapter.commit()
+
+        return QueryResult(success=True, message="Successfully executed query.", rows=rows,
+                           header=header, time_taken=time.perf_counter() - start_time)
+
+    except Exception as e:
+        try:
+            await adapter.rollback()
+        except Exception:
+            # the connection itself is broken, it is reconnected on its next use
+            await adapter.disconnect()
+
+        return QueryResult(success=False, message=_error_message(e),
+                           time_taken=time.perf_counter() - start_time)
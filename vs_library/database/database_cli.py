@@ -469,3 +469,27 @@ class ExportQueryResults(pandas_extension_cli.ExportSpreadsheet):
     def _execute(self):
         return super()._execute(self.query_tool.export)
 
+
+class PreviewQueryResults(pandas_extension_cli.PreviewSpreadsheet):
+
+    """Query results can be looked through a page at a time before they are exported"""
+
+    def __init__(self, query_tool, page_size=20, parent=None):
+
+        """
+        Parameters
+        ----------
+        query_tool : database.QueryTool
+            The controller of this NodeBunde
+
+        page_size : int, default=20
+            Number of rows drawn on each page
+        """
+
+        name = 'preview-query-results'
+        self.query_tool = query_tool
+
+        super().__init__(name, page_size=page_size, parent=parent)
+
+    def _populate_table(self):
+        return super()._populate_table(self.query_tool.results('pandas_df'))
@@ -1,2 +1,3 @@
 from . import pandas_extension
+from . import progress
 from . import recordmatch
\ No newline at end of file
@@ -1,14 +1,31 @@
 
 # built-ins
+import io
 import os
+import mmap
+import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 # external packages
 import pandas
 import numpy
+import pyarrow
+import pyarrow.dataset
+import pyarrow.ipc
+import pyarrow.parquet
+from openpyxl import Workbook
+from rapidfuzz import fuzz, process
 
+# internal packages
+from .progress import Progress
 
-def read_spreadsheet(filepath, **kwargs):
+
+# maximum number of rows in an Excel worksheet, header row included
+EXCEL_MAX_ROWS = 1048576
+
+
+def read_spreadsheet(filepath, progress=None, **kwargs):
 
     """Reads a spreadsheet format file and converts it to pandas.DataFrame
     
@@ -19,14 +36,42 @@ def read_spreadsheet(filepath, **kwargs):
     ----------
     filepath : str
         Path to spreadsheet file on user's computer to be imported
+
+    Columnar files (.parquet, .feather, .arrow) accept the keyword arguments
+    'columns' to only read the listed columns and 'filters' to skip rows that do 
+    not satisfy the predicates, ex. [('state_id', 'in', ['NY', 'NJ'])]. On a 
+    parquet file, row groups whose statistics fail the filters are never read.
+
+    Delimited files (.csv, .tsv) accept the keyword argument 'processes' to 
+    memory-map the file and parse its rows in parallel, see MappedDelimitedFile.
+
+    progress : function, optional
+        Takes a ProgressUpdate, see progress.Progress. Rows are reported as they are
+        parsed when reading in parallel, otherwise once the file is read
     """
 
     _ , ext = os.path.splitext(filepath)
 
+    reporter = Progress(progress, 'Reading') if progress else None
+
+    # not a keyword of the pandas readers, even when None or 0
+    processes = kwargs.pop('processes', None)
+
     try:
-        if ext in ('.xls', '.xlsx', '.xlsm', '.xlsb', '.ods'):
+        if ext in ('.csv', '.tsv') and processes:
+            with MappedDelimitedFile(filepath, sep=kwargs.pop('sep', None), 
+                                     encoding=kwargs.pop('encoding', 'utf-8')) as mapped:
+                df = mapped.read_parallel(processes=processes, progress=reporter, **kwargs)
+
+        elif ext in ('.xls', '.xlsx', '.xlsm', '.xlsb', '.ods'):
             df = pandas.read_excel(filepath, **kwargs)
 
+        elif ext == '.parquet':
+            df = pandas.read_parquet(filepath, engine='pyarrow', **kwargs)
+
+        elif ext in ('.feather', '.arrow'):
+            df = _read_arrow_ipc(filepath, **kwargs)
+
         elif ext == '.csv':
             df = pandas.read_csv(filepath, **kwargs)
         
@@ -37,6 +82,9 @@ def read_spreadsheet(filepath, **kwargs):
             df = pandas.DataFrame()
             return df, f"File not imported. Extension: \'{ext}\' not recognized"
 
+        if reporter:
+            reporter.finish(len(df))
+
         return df, f"File successfully imported as \'{os.path.basename(filepath)}\'"
 
     except Exception as e:
@@ -46,7 +94,221 @@ def read_spreadsheet(filepath, **kwargs):
         return df, f"ERROR: {str(e)}"
 
 
-def to_spreadsheet(df, filepath):
+def _read_arrow_ipc(filepath, columns=None, filters=None):
+
+    """Reads a Feather (V2) or Arrow IPC file with optional column projection and row filters"""
+
+    dataset = pyarrow.dataset.dataset(filepath, format='ipc')
+    expression = pyarrow.parquet.filters_to_expression(filters) if filters else None
+
+    return dataset.to_table(columns=columns, filter=expression).to_pandas()
+
+
+def _parse_delimited(filepath, sep, columns, start, stop, kwargs):
+
+    """Parses the rows between two byte offsets of a delimited file"""
+
+    with open(filepath, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            data = mapped[start:stop]
+
+    return pandas.read_csv(io.BytesIO(data), sep=sep, header=None, names=columns, **kwargs)
+
+
+def _concatenates_as_read(parts):
+
+    """
+    Whether parts of a column parsed separately concatenate to what parsing them together gives,
+    which is when they share a type or are all numbers, as integers with blanks are floats anyway
+    """
+
+    dtypes = [part.dtype for part in parts]
+
+    return len(set(map(str, dtypes))) == 1 or \
+           all(pandas.api.types.is_numeric_dtype(d) and not pandas.api.types.is_bool_dtype(d) for d in dtypes)
+
+
+class MappedDelimitedFile:
+
+    """
+    Memory-maps a delimited file (.csv, .tsv) and indexes the offset of every row,
+    so that any range of rows can be parsed without reading the rows before it
+
+    The first line is taken as the header. Quoted values that contain line breaks
+    are not supported, as rows are located by their line breaks.
+
+    Attributes
+    ----------
+    columns : list
+        Column names found in the header
+    
+    offsets : numpy.ndarray
+        Byte offset of the start of each row, followed by the end of the last row
+    """
+
+    # bytes scanned at a time when looking for line breaks
+    SCAN_SIZE = 64 * 1024 * 1024
+
+    def __init__(self, filepath, sep=None, encoding='utf-8'):
+
+        """
+        Parameters
+        ----------
+        filepath : str
+            Path to a delimited file on user's computer
+
+        sep : str, optional
+            Delimiter of the file, inferred from the extension if not given
+
+        encoding : str, default='utf-8'
+            Encoding of the file
+        """
+
+        _ , ext = os.path.splitext(filepath)
+
+        self.filepath = filepath
+        self.sep = sep if sep else '\t' if ext == '.tsv' else ','
+        self.encoding = encoding
+
+        self.__file = open(filepath, 'rb')
+        self.__mapped = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ) \
+                        if os.path.getsize(filepath) else None
+
+        self.offsets = self._scan_offsets()
+
+        header = self.__mapped[:self.offsets[0]] if self.__mapped else b''
+        self.columns = pandas.read_csv(io.BytesIO(header), sep=self.sep, encoding=encoding, 
+                                       nrows=0).columns.tolist() if header.strip() else []
+
+    def _scan_offsets(self):
+
+        """Finds line breaks a block at a time with numpy instead of reading line by line"""
+
+        size = len(self.__mapped) if self.__mapped else 0
+        breaks = []
+
+        for start in range(0, size, self.SCAN_SIZE):
+            block = numpy.frombuffer(self.__mapped, dtype=numpy.uint8, 
+                                     count=min(self.SCAN_SIZE, size - start), offset=start)
+            breaks.append(numpy.flatnonzero(block == ord('\n')) + start + 1)
+            # the buffer has to be released before the map can be closed
+            del block
+
+        offsets = numpy.concatenate(breaks) if breaks else numpy.array([], dtype=numpy.int64)
+
+        # the last row might not end with a line break
+        if not offsets.size or offsets[-1] != size:
+            offsets = numpy.append(offsets, size)
+
+        return offsets.astype(numpy.int64)
+
+    def __len__(self):
+        return max(len(self.offsets) - 1, 0)
+
+    def byte_range(self, start, stop):
+
+        """Returns the byte offsets spanning rows start to stop"""
+
+        start, stop, _ = slice(start, stop).indices(len(self))
+        return int(self.offsets[start]), int(self.offsets[max(start, stop)])
+
+    def read_rows(self, start=0, stop=None, **kwargs):
+
+        """
+        Parses a range of rows into a pandas.DataFrame
+
+        Parameters
+        ----------
+        start : int
+            Position of the first row, not counting the header
+
+        stop : int, optional
+            Position after the last row, reads to the end of file if not given
+
+        **kwargs
+            Passed to pandas.read_csv, ex. dtype or usecols
+        """
+
+        begin, end = self.byte_range(start, stop)
+        data = self.__mapped[begin:end] if self.__mapped else b''
+
+        if not data.strip():
+            return pandas.DataFrame(columns=self.columns)
+
+        return pandas.read_csv(io.BytesIO(data), sep=self.sep, header=None, names=self.columns, 
+                               encoding=self.encoding, **kwargs)
+
+    def iter_chunks(self, chunksize=100000, **kwargs):
+
+        """Yields the file as pandas.DataFrame of at most chunksize rows"""
+
+        for start in range(0, len(self), chunksize):
+            yield self.read_rows(start, start + chunksize, **kwargs)
+
+    def read_parallel(self, processes=None, chunksize=None, progress=None, **kwargs):
+
+        """
+        Parses row ranges in separate processes and concatenates them in order
+
+        Parameters
+        ----------
+        processes : int, optional
+            Number of worker processes, defaults to the number of CPUs
+
+        chunksize : int, optional
+            Number of rows per task, defaults to splitting rows evenly across processes
+
+        progress : progress.Progress, optional
+            Updated with the rows parsed as each task completes
+
+        Returns the same DataFrame as pandas.read_csv(..., low_memory=False)
+        """
+
+        processes = processes or os.cpu_count() or 1
+        chunksize = chunksize or max(-(-len(self) // processes), 1)
+
+        ranges = [self.byte_range(start, start + chunksize) for start in range(0, len(self), chunksize)]
+
+        if len(ranges) <= 1 or processes == 1:
+            return self.read_rows(**kwargs)
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(_parse_delimited, self.filepath, self.sep, self.columns, 
+                                       start, stop, {**kwargs, 'encoding': self.encoding}) 
+                       for start, stop in ranges]
+            dfs = []
+
+            for future in futures:
+                dfs.append(future.result())
+
+                if progress:
+                    progress.update(sum(map(len, dfs)), total=len(self))
+
+        df = pandas.concat(dfs, ignore_index=True)
+
+        # each range infers the types of its own rows, ex. 01234 is read as a number in a range
+        # and A1234 as text in another, so columns typed differently by two ranges are read 
+        # again as a whole, in one piece so that a column gets a single type
+        mixed = [column for column in df.columns if not _concatenates_as_read([d[column] for d in dfs])]
+
+        if mixed:
+            df[mixed] = self.read_rows(**{'low_memory': False, **kwargs, 'usecols': mixed})[mixed]
+
+        return df
+
+    def close(self):
+        if self.__mapped:
+            self.__mapped.close()
+        self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def to_spreadsheet(df, filepath, chunksize=None, progress=None, compression=None):
 
     """
     Converts a pandas.DataFrame into a spreadsheet file
@@ -54,19 +316,62 @@ def to_spreadsheet(df, filepath):
     See more on pandas.DataFrame at:
     https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.html
 
+    Exports are streamed when a chunksize is given, when df is an iterator of
+    DataFrames or when df does not fit in a single Excel worksheet. Streamed Excel
+    files are written with openpyxl's write-only worksheets and rows that exceed
+    EXCEL_MAX_ROWS continue on a new sheet.
+
     Parameters
     ----------
-    df : pandas.DataFrame()
-        Not empty dataframe to be exported
+    df : pandas.DataFrame() or iterable of pandas.DataFrame()
+        Not empty dataframe to be exported, or chunks of dataframes sharing the same columns
 
     filepath : str
         Path on a user's computer where pandas.DataFrame() is to be exported
+
+    chunksize : int, optional
+        Number of rows to write at a time
+
+    progress : function, optional
+        Takes a ProgressUpdate, see progress.Progress. Rows are reported as each chunk is written
+        when streaming, otherwise once the file is written
+
+    compression : str, optional
+        Compression codec of columnar files, ex. 'snappy', 'zstd', 'lz4' or 'uncompressed'.
+        Each format's own default is used if not given
     """
 
     _ , ext = os.path.splitext(filepath)
 
+    streaming = chunksize or not isinstance(df, pandas.DataFrame) or len(df) >= EXCEL_MAX_ROWS
+
+    reporter = Progress(progress, 'Writing', total=len(df) if isinstance(df, pandas.DataFrame) else 0) \
+               if progress else None
+
     try:
-        if ext in ('.ods', '.xlsx', '.xlsm', '.xlsb'):
+        if streaming and ext in ('.xlsx', '.xlsm'):
+            rows, seconds = _stream_excel(_iter_chunks(df, chunksize), filepath, reporter)
+
+        elif streaming and ext in ('.csv', '.tsv'):
+            rows, seconds = _stream_delimited(_iter_chunks(df, chunksize), filepath, 
+                                              '\t' if ext == '.tsv' else ',', reporter)
+
+        elif streaming and ext in ('.parquet', '.feather', '.arrow'):
+            rows, seconds = _stream_columnar(_iter_chunks(df, chunksize), filepath, 
+                                             compression, reporter)
+
+        elif ext == '.parquet':
+            df.to_parquet(filepath, engine='pyarrow', index=False, 
+                          **({'compression': compression} if compression else {}))
+
+        elif ext in ('.feather', '.arrow'):
+            # Feather V2 is the Arrow IPC file format
+            df.reset_index(drop=True).to_feather(filepath, 
+                                                 **({'compression': compression} if compression else {}))
+
+        elif ext in ('.ods', '.xlsx', '.xlsm', '.xlsb'):
+            if not isinstance(df, pandas.DataFrame):
+                df = pandas.concat(list(df), ignore_index=True)
             df.to_excel(filepath, index=False)
 
         elif ext == '.csv':
@@ -78,12 +383,163 @@ def to_spreadsheet(df, filepath):
         else:
             return False, f"File not exported. Extension: \'{ext}\' not recognized"
 
-        return True, f"File successfully exported to \'{os.path.abspath(filepath)}\'"
+        if reporter:
+            reporter.finish(len(df) if isinstance(df, pandas.DataFrame) else rows)
+
+        message = f"File successfully exported to \'{os.path.abspath(filepath)}\'"
+
+        if streaming and ext in ('.xlsx', '.xlsm', '.csv', '.tsv', '.parquet', '.feather', '.arrow'):
+            message += f"\n{rows} rows written in {round(seconds, 2)}s " \
+                       f"({round(rows / seconds) if seconds else rows} rows/s)"
+
+        return True, message
 
     except Exception as e:
         return False, f"ERROR: {str(e)}"
 
 
+def _iter_chunks(df, chunksize=None):
+
+    """Yields a pandas.DataFrame in chunks of rows, or the chunks of an iterable as they are"""
+
+    if not isinstance(df, pandas.DataFrame):
+        yield from df
+
+    elif not chunksize or len(df) <= chunksize:
+        yield df
+
+    else:
+        for start in range(0, len(df), chunksize):
+            yield df.iloc[start:start + chunksize]
+
+
+def _stream_delimited(chunks, filepath, sep, progress=None):
+
+    """
+    Appends chunks to a delimited file, only the first chunk writes the header
+
+    Returns
+    -------
+    (rows written, seconds elapsed)
+    """
+
+    rows = 0
+    start_time = time.perf_counter()
+
+    with open(filepath, 'w', newline='') as f:
+        for index, chunk in enumerate(chunks):
+            chunk.to_csv(f, sep=sep, index=False, header=index == 0)
+            rows += len(chunk)
+
+            if progress:
+                progress.update(rows)
+
+    return rows, time.perf_counter() - start_time
+
+
+def _stream_columnar(chunks, filepath, compression=None, progress=None):
+
+    """
+    Writes chunks as parquet row groups or Arrow IPC record batches, 
+    every chunk is cast to the schema of the first
+
+    Returns
+    -------
+    (rows written, seconds elapsed)
+    """
+
+    _ , ext = os.path.splitext(filepath)
+
+    writer = None
+    schema = None
+    rows = 0
+    start_time = time.perf_counter()
+
+    try:
+        for chunk in chunks:
+            table = pyarrow.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+
+            if writer is None:
+                schema = table.schema
+
+                if ext == '.parquet':
+                    writer = pyarrow.parquet.ParquetWriter(filepath, schema, 
+                                                           compression=compression or 'snappy')
+                else:
+                    options = pyarrow.ipc.IpcWriteOptions(
+                        compression=None if compression in (None, 'uncompressed') else compression)
+                    writer = pyarrow.ipc.new_file(filepath, schema, options=options)
+
+            writer.write_table(table)
+            rows += len(chunk)
+
+            if progress:
+                progress.update(rows)
+
+    finally:
+        if writer:
+            writer.close()
+
+    if writer is None:
+        raise ValueError("No data was given to be exported")
+
+    return rows, time.perf_counter() - start_time
+
+
+def _stream_excel(chunks, filepath, progress=None):
+
+    """
+    Appends chunks to write-only worksheets so the workbook is never held in memory,
+    a new worksheet is started whenever a sheet reaches EXCEL_MAX_ROWS
+
+    Returns
+    -------
+    (rows written, seconds elapsed)
+    """
+
+    workbook = Workbook(write_only=True)
+    worksheet = None
+    header = None
+    sheet_rows = 0
+    rows = 0
+    start_time = time.perf_counter()
+
+    def new_sheet():
+        nonlocal worksheet, sheet_rows
+        worksheet = workbook.create_sheet(title=f"Sheet{len(workbook.worksheets) + 1}")
+        worksheet.append(header)
+        sheet_rows = 1
+
+    for chunk in chunks:
+        if header is None:
+            header = [str(column) for column in chunk.columns]
+            new_sheet()
+
+        # blanks are written as empty cells instead of NaN
+        values = chunk.astype(object).where(chunk.notna(), None)
+
+        for row in values.itertuples(index=False, name=None):
+            if sheet_rows >= EXCEL_MAX_ROWS:
+                new_sheet()
+
+            worksheet.append(row)
+            sheet_rows += 1
+
+        rows += len(chunk)
+
+        if progress:
+            progress.update(rows)
+
+    # an empty iterable still produces a valid workbook
+    if worksheet is None:
+        header = []
+        new_sheet()
+
+    workbook.save(filepath)
+
+    return rows, time.perf_counter() - start_time
+
+
 def column_group_percentage(df, col):
 
     """
@@ -173,10 +629,194 @@ def get_column_blanks(df, column):
     return blank_index, blanks
 
 
-class PandasMatcher:
+class SparseScores:
+
+    """
+    Scores of the candidates of df_from kept for each row of df_to, in CSR-like arrays:
+    the candidates of row i are indices[indptr[i]:indptr[i + 1]] with their scores
+    at the same positions
+    """
+
+    __slots__ = ('indptr', 'indices', 'scores')
+
+    def __init__(self, indptr, indices, scores):
+        self.indptr = indptr
+        self.indices = indices
+        self.scores = scores
+
+    @classmethod
+    def from_rows(cls, rows):
+
+        """
+        Parameters
+        ----------
+        rows : list
+            [(indices_from, scores) of each row of df_to]
+        """
+
+        indptr = numpy.zeros(len(rows) + 1, dtype=numpy.int64)
+        indptr[1:] = numpy.cumsum([len(indices_from) for indices_from, _ in rows])
+
+        if not rows:
+            return cls(indptr, numpy.empty(0, dtype=numpy.int64), numpy.empty(0, dtype=numpy.float64))
+
+        return cls(indptr,
+                   numpy.concatenate([indices_from for indices_from, _ in rows]).astype(numpy.int64),
+                   numpy.concatenate([scores for _, scores in rows]).astype(numpy.float64))
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def __getitem__(self, index_to):
+        start, end = self.indptr[index_to], self.indptr[index_to + 1]
+        return self.indices[start:end], self.scores[start:end]
+
+    @property
+    def nbytes(self):
+        return self.indptr.nbytes + self.indices.nbytes + self.scores.nbytes
+
+    def to_frame(self):
+
+        """
+        Returns
+        -------
+        pandas.DataFrame
+            index_to, index_from and score of every candidate kept, the highest scores of a row first
+        """
+
+        df = pandas.DataFrame({'index_to': numpy.repeat(numpy.arange(len(self)), numpy.diff(self.indptr)),
+                               'index_from': self.indices,
+                               'score': self.scores})
+
+        return df.sort_values(['index_to', 'score'], ascending=[True, False], kind='stable', ignore_index=True)
+
+
+class CandidateScores:
+
+    """
+    Raw scores by column of the candidates of df_from kept for each row of df_to, in CSR-like
+    arrays: the candidates of row i are indices[indptr[i]:indptr[i + 1]], with their scores
+    by column in the rows of scores at the same positions. bounds[i] is the highest combined
+    score of the candidates of row i that were left out, 0 if none were
+    """
+
+    __slots__ = ('columns', 'indptr', 'indices', 'scores', 'bounds')
+
+    def __init__(self, columns, indptr, indices, scores, bounds):
+        self.columns = columns
+        self.indptr = indptr
+        self.indices = indices
+        self.scores = scores
+        self.bounds = bounds
+
+    @classmethod
+    def from_rows(cls, columns, rows):
+
+        """
+        Parameters
+        ----------
+        columns : list
+            Columns of df_to, in the order of the scores of a candidate
+
+        rows : list
+            [(indices_from, scores, bound) of each row of df_to], scores having a column
+            for each column of df_to
+        """
+
+        indptr = numpy.zeros(len(rows) + 1, dtype=numpy.int64)
+        indptr[1:] = numpy.cumsum([len(indices_from) for indices_from, _, _ in rows])
+        bounds = numpy.array([bound for _, _, bound in rows], dtype=numpy.float64)
+
+        if not rows:
+            return cls(list(columns), indptr, numpy.empty(0, dtype=numpy.int64),
+                       numpy.empty((0, len(columns)), dtype=numpy.float64), bounds)
+
+        return cls(list(columns), indptr,
+                   numpy.concatenate([indices_from for indices_from, _, _ in rows]).astype(numpy.int64),
+                   numpy.concatenate([scores for _, scores, _ in rows]).astype(numpy.float64),
+                   bounds)
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def __getitem__(self, index_to):
+        start, end = self.indptr[index_to], self.indptr[index_to + 1]
+        return self.indices[start:end], self.scores[start:end], self.bounds[index_to]
+
+    @property
+    def nbytes(self):
+        return self.indptr.nbytes + self.indices.nbytes + self.scores.nbytes + self.bounds.nbytes
+
+
+class ScoreCache:
+
+    """
+    Raw similarity scores of every row of a PandasMatcher's df_to against df_from
+
+    The scores only depend on the data, the columns of df_from each column is compared to,
+    the column groups, the scorers and how many candidates are kept, so they are kept
+    between matches and a change of thresholds, cutoffs or the required threshold only
+    needs the scores to be aggregated again. Scores of 0 are not kept.
+
+    Matches take the CandidateScores of all the columns to match, kept by the combined score
+    of a row. The audit of PandasMatcher.candidates takes the SparseScores of each column,
+    kept by the score of the column.
+
+    Only a PandasMatcher with cache_scores keeps its scores here, the tabular_matcher configured through
+    pandas_extension_cli.TBSettings scores every row again on each match.
+    """
 
     def __init__(self):
 
+        # {(columns, column_groups, top_k): CandidateScores,
+        #  (column_to, columns_from, column_groups, scorer, top_k): SparseScores}
+        self.__columns = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.__columns)
+
+    def __contains__(self, key):
+        return key in self.__columns
+
+    def get(self, key):
+
+        """Scores by row of df_to, None if they have not been computed"""
+
+        rows = self.__columns.get(key)
+
+        if rows is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return rows
+
+    def put(self, key, rows):
+        self.__columns[key] = rows
+
+    def clear(self):
+        self.__columns.clear()
+
+    @property
+    def nbytes(self):
+        return sum(rows.nbytes for rows in self.__columns.values())
+
+
+class PandasMatcher:
+
+    def __init__(self, cache_scores=False):
+
+        """
+        Parameters
+        ----------
+        cache_scores : bool, default=False
+            If True, raw scores are kept in the score cache between matches, which takes
+            memory by the rows of df_to, the candidates kept and the columns to match
+        """
+
         self.__df_to = pandas.DataFrame()
         self.__df_from = pandas.DataFrame()
 
@@ -188,9 +828,20 @@ class PandasMatcher:
         # [column_1, column_2, ...]
         self.column_groups = []
 
+        # scorer of each column, see rapidfuzz.fuzz
+        self.column_scorer = defaultdict(lambda: fuzz.WRatio)
+
         self.required_threshold = 75.0
         self.cutoff = False
 
+        # candidates kept in the score cache for each row of df_to, the top_k of the row's
+        # combined score with the ones tied with the last, None keeps every candidate.
+        # A row whose match could be one left out, after a cutoff, is scored again
+        self.top_k = 50
+
+        self.__scores = ScoreCache()
+        self.cache_scores = cache_scores
+
     @property
     def df_to(self):
         return self.__df_to
@@ -199,9 +850,25 @@ class PandasMatcher:
     def df_from(self):
         return self.__df_from
 
+    @property
+    def scores(self):
+        return self.__scores
+
+    @property
+    def cache_scores(self):
+        return self.__cache_scores
+
+    @cache_scores.setter
+    def cache_scores(self, cache_scores):
+        self.__cache_scores = cache_scores
+
+        if not cache_scores:
+            self.__scores.clear()
+
     @df_to.setter
     def df_to(self, df):
         self.__df_to = df.astype(str).replace('nan', '')
+        self.__scores.clear()
         self.columns_to_match.clear()
 
         for column_to in self.__df_to.columns:
@@ -214,6 +881,7 @@ class PandasMatcher:
     @df_from.setter
     def df_from(self, df):
         self.__df_from = df.astype(str).replace('nan', '')
+        self.__scores.clear()
         self.columns_to_get.clear()
 
         for _, columns_from in self.columns_to_match.items():
@@ -269,35 +937,292 @@ class PandasMatcher:
 
         return df.index
 
-    def _compute_score(self, choices, index_to, uniqueness):
+    def _compute_score(self, choices, column_to, row_to, indices_to_compare, top_k=None):
+
+        """
+        Raw scores of a value of df_to against its choices, if top_k is given only the top_k
+        highest and the ones tied with the last of them are kept
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray)
+            indices of df_from and their scores above 0
+        """
+
+        query = choices[column_to].iloc[indices_to_compare]
+        if query.empty:
+            query = choices[column_to]
+
+        scores = process.cdist([row_to[column_to]], query.tolist(),
+                               scorer=self.column_scorer[column_to],
+                               dtype=numpy.float64)[0]
+
+        if top_k and len(scores) > top_k:
+            # partial sort, only the k-th highest score is put in place
+            lowest_kept = numpy.partition(scores, len(scores) - top_k)[len(scores) - top_k]
+            kept = numpy.flatnonzero((scores >= lowest_kept) & (scores > 0))
+        else:
+            kept = numpy.flatnonzero(scores > 0)
+
+        return query.index.to_numpy(dtype=numpy.int64)[kept], scores[kept]
+
+    def _row_scores(self, choices, columns_to_match, index_to):
+
+        """
+        Raw scores of a row of df_to against every candidate, by column
+
+        Returns
+        -------
+        dict
+            {column_to: (indices of df_from, scores)}
+        """
 
-        match_scores = defaultdict(float)
         row_to = self.__df_to.iloc[index_to]
         indices_to_compare = self.__subset(row_to)
 
-        for column_to, columns_from in self.columns_to_match.items():
+        return {column_to: self._compute_score(choices, column_to, row_to, indices_to_compare)
+                for column_to in columns_to_match}
+
+    def _keep_candidates(self, row_scores, uniqueness):
+
+        """
+        Keeps the top_k candidates of a row of df_to by their combined score, and the ones
+        tied with the last of them
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray, float)
+            indices of df_from, their raw scores by column and the highest combined score
+            of the candidates left out
+        """
+
+        if not row_scores:
+            return numpy.empty(0, dtype=numpy.int64), numpy.empty((0, 0)), 0.0
+
+        candidates, positions = numpy.unique(numpy.concatenate([indices_from for indices_from, _ in row_scores.values()]),
+                                             return_inverse=True)
+
+        scores = numpy.zeros((len(candidates), len(row_scores)))
+        combined = numpy.zeros(len(candidates))
+        start = 0
+
+        for i, (column_to, (indices_from, column_values)) in enumerate(row_scores.items()):
+            scores[positions[start:start + len(indices_from)], i] = column_values
+            combined += scores[:, i] * uniqueness[column_to]
+            start += len(indices_from)
+
+        if not self.top_k or len(candidates) <= self.top_k:
+            return candidates, scores, 0.0
+
+        # partial sort, only the k-th highest combined score is put in place
+        lowest_kept = numpy.partition(combined, len(combined) - self.top_k)[len(combined) - self.top_k]
+        kept = combined >= lowest_kept
+        bound = combined[~kept].max() if not kept.all() else 0.0
+
+        return candidates[kept], scores[kept], float(bound)
+
+    def _candidate_scores(self, columns_to_match, uniqueness, progress=None):
+
+        """
+        Candidates kept for each row of df_to, taken from the score cache when they have
+        already been computed for the current columns, groups and scorers, otherwise
+        computed and cached
+
+        Returns
+        -------
+        CandidateScores
+        """
+
+        key = (tuple((column_to, tuple(self.columns_to_match[column_to]), self.column_scorer[column_to])
+                     for column_to in columns_to_match),
+               tuple(self.column_groups), self.top_k)
+
+        candidate_scores = self.__scores.get(key)
+
+        if candidate_scores is not None:
+            return candidate_scores
+
+        choices = self._choices()
+        reporter = Progress(progress, 'Scoring', total=len(self.__df_to)) if progress else None
+        rows = []
+
+        for index_to in range(0, len(self.__df_to)):
+
+            if reporter:
+                reporter.update(index_to)
+
+            rows.append(self._keep_candidates(self._row_scores(choices, columns_to_match, index_to), uniqueness))
+
+        candidate_scores = CandidateScores.from_rows(columns_to_match, rows)
+        self.__scores.put(key, candidate_scores)
+
+        if reporter:
+            reporter.finish()
+
+        return candidate_scores
+
+    def _column_scores(self, columns_to_match, progress=None):
+
+        """
+        Raw scores of each column to match, the top_k of each column, for the audit of
+        candidates. Taken from the score cache when they have already been computed for the
+        current columns, groups and scorers, otherwise computed and, if cache_scores is set, cached
+
+        Returns
+        -------
+        dict
+            {column_to: SparseScores}
+        """
+
+        keys = {column_to: (column_to, tuple(self.columns_to_match[column_to]),
+                            tuple(self.column_groups), self.column_scorer[column_to], self.top_k)
+                for column_to in columns_to_match}
+
+        column_scores = {column_to: self.__scores.get(key) for column_to, key in keys.items()}
+        to_compute = [column_to for column_to, rows in column_scores.items() if rows is None]
+
+        if not to_compute:
+            return column_scores
+
+        choices = self._choices()
+        reporter = Progress(progress, 'Scoring', total=len(self.__df_to)) if progress else None
+
+        for column_to in to_compute:
+            column_scores[column_to] = []
+
+        for index_to in range(0, len(self.__df_to)):
+
+            if reporter:
+                reporter.update(index_to)
+
+            row_to = self.__df_to.iloc[index_to]
+            indices_to_compare = self.__subset(row_to)
+
+            for column_to in to_compute:
+                column_scores[column_to].append(self._compute_score(choices, column_to, row_to,
+                                                                    indices_to_compare, self.top_k))
+
+        for column_to in to_compute:
+            column_scores[column_to] = SparseScores.from_rows(column_scores[column_to])
 
-            if columns_from:
-                value_to_compare = row_to[column_to]
-                query = choices[column_to].iloc[indices_to_compare]
-                if query.empty:
-                    query = choices[column_to]
+            if self.__cache_scores:
+                self.__scores.put(keys[column_to], column_scores[column_to])
 
-                matches = process.extract(value_to_compare, query,
-                                          scorer=fuzz.WRatio,
-                                          limit=len(self.__df_from),
-                                          score_cutoff=0 if not self.cutoff 
-                                                         else self.column_threshold[column_to])
+        if reporter:
+            reporter.finish()
 
-                for _, score, index_from in matches:
-                    match_scores[index_from] += score * uniqueness[column_to]
+        return column_scores
 
-        return match_scores
+    def _aggregate(self, row_scores, uniqueness):
+
+        """
+        Sums the raw scores of a row of df_to weighted by the uniqueness of their column,
+        leaving out the scores under the threshold of their column if cutoff is set
+
+        Parameters
+        ----------
+        row_scores : dict
+            {column_to: (indices of df_from, scores)} of the row
+
+        Returns
+        -------
+        dict
+            {index_from: match score}
+        """
+
+        indices_from, scores = [], []
+
+        for column_to, (column_indices, column_values) in row_scores.items():
+
+            if self.cutoff:
+                kept = column_values >= self.column_threshold[column_to]
+                column_indices, column_values = column_indices[kept], column_values[kept]
+
+            indices_from.append(column_indices)
+            scores.append(column_values * uniqueness[column_to])
+
+        if not indices_from:
+            return {}
+
+        candidates, positions = numpy.unique(numpy.concatenate(indices_from), return_inverse=True)
+        match_scores = numpy.bincount(positions, weights=numpy.concatenate(scores), minlength=len(candidates))
+
+        return dict(zip(candidates.tolist(), match_scores.tolist()))
+
+    def _aggregate_kept(self, candidate_scores, index_to, uniqueness):
+
+        """
+        Sums the raw scores of the candidates kept for a row of df_to as _aggregate does
+
+        Returns
+        -------
+        dict or None
+            {index_from: match score}, None if a candidate left out could score as high as
+            the highest once the cutoff is applied, the row has to be scored again then
+        """
+
+        indices_from, scores, bound = candidate_scores[index_to]
+
+        match_scores = numpy.zeros(len(indices_from))
+        scored = numpy.zeros(len(indices_from), dtype=bool)
+
+        for i, column_to in enumerate(candidate_scores.columns):
+            column_values = scores[:, i]
+
+            if self.cutoff:
+                column_values = numpy.where(column_values >= self.column_threshold[column_to], column_values, 0.0)
+
+            scored |= column_values > 0
+            match_scores += column_values * uniqueness[column_to]
+
+        indices_from, match_scores = indices_from[scored], match_scores[scored]
+
+        # a candidate left out scores at most the bound, as the cutoff only takes scores away,
+        # so it can only change the match if it reaches the highest and the required threshold
+        if round(bound, 2) >= round(self.required_threshold, 2) and (not len(match_scores) or
+                                                                    match_scores.max() <= bound):
+            return None
+
+        return dict(zip(indices_from.tolist(), match_scores.tolist()))
+
+    def candidates(self, progress=None):
+
+        """
+        Candidates of df_from kept for each row of df_to by column, the top_k of each column,
+        to audit the near misses of a match
+
+        Parameters
+        ----------
+        progress : function, optional
+            Takes a ProgressUpdate, reported as rows of df_to are scored if they are not cached
+
+        Returns
+        -------
+        pandas.DataFrame
+            index_to, column, index_from and raw score of each candidate, the highest scores
+            of a row and column first
+        """
+
+        columns_to_match = [column for column in self.columns_to_match.keys() if self.columns_to_match[column]]
+        frames = []
+
+        for column_to, rows in self._column_scores(columns_to_match, progress).items():
+            df = rows.to_frame()
+            df.insert(1, 'column', column_to)
+            frames.append(df)
+
+        if not frames:
+            return pandas.DataFrame(columns=['index_to', 'column', 'index_from', 'score'])
+
+        return pandas.concat(frames).sort_values(['index_to', 'column'], kind='stable', ignore_index=True)
 
     def _top_matches(self, match_scores, optimal_threshold):
 
         def filter_highest(y):
-            return {k: v for k, v in y.items() if v == max(y.values())}
+            if not y:
+                return {}
+            highest = max(y.values())
+            return {k: v for k, v in y.items() if v == highest}
 
         top_matches = defaultdict(dict)
 
@@ -310,13 +1235,39 @@ class PandasMatcher:
 
         return top_matches
 
-    def match(self):
+    def match(self, progress=None):
+
+        """
+        Matches every row of df_to to the row of df_from with the highest score
+
+        Each row of df_to is scored then matched, its scores are let go before the next row.
+        With cache_scores, raw scores are kept in the score cache instead, so matching again
+        after changing only the thresholds, the cutoff or the required threshold does not
+        score the rows again
+
+        Parameters
+        ----------
+        progress : function, optional
+            Takes a ProgressUpdate, see progress.Progress, reported as rows of df_to are scored
+            then matched
+
+        Returns
+        -------
+        (pandas.DataFrame, dict)
+            df_to with the columns to get, match status, row index and score of its match,
+            and a summary of the match
+        """
 
         columns_to_match = [column for column in self.columns_to_match.keys() if self.columns_to_match[column]]
         uniqueness = adjusted_uniqueness(self.__df_to, columns_to_match)
         optimal_threshold = sum([self.column_threshold[column] * uniqueness[column] for column in columns_to_match])
 
-        choices = self._choices()
+        if self.__cache_scores:
+            candidate_scores = self._candidate_scores(columns_to_match, uniqueness, progress)
+            choices = None
+        else:
+            choices = self._choices()
+
         df_matched = self.__df_to.copy()
 
         scores = []
@@ -329,9 +1280,20 @@ class PandasMatcher:
         df_matched['row_index'] = ''
         df_matched['match_score'] = ''
 
-        for index_to in tqdm(range(0, len(self.__df_to))):
+        reporter = Progress(progress, 'Matching', total=len(self.__df_to)) if progress else None
 
-            match_scores = self._compute_score(choices, index_to, uniqueness)
+        for index_to in range(0, len(self.__df_to)):
+
+            if reporter:
+                reporter.update(index_to)
+
+            match_scores = self._aggregate_kept(candidate_scores, index_to, uniqueness) if self.__cache_scores else None
+
+            if match_scores is None:
+                if choices is None:
+                    choices = self._choices()
+
+                match_scores = self._aggregate(self._row_scores(choices, columns_to_match, index_to), uniqueness)
             top_matches = self._top_matches(match_scores, optimal_threshold)
 
             if len(top_matches) == 1:
@@ -355,6 +1317,9 @@ class PandasMatcher:
             else:
                 df_matched.at[index_to, 'match_status'] = 'UNMATCHED'
 
+        if reporter:
+            reporter.finish()
+
         dupe_index, _ = get_column_dupes(df_matched, 'row_index')
         df_matched.loc[dupe_index, 'match_status'] = "DUPLICATES"
 
@@ -1,7 +1,7 @@
 
 # internal packages
 from . import pandas_extension
-from ..cli import Node, NodeBundle, DecoyNode, textformat
+from ..cli import Node, NodeBundle, DecoyNode, LazyNode, textformat
 from ..cli.objects import Command, Display, Prompt, Table
 
 # external packages
@@ -124,7 +124,7 @@ class ImportSpreadsheets(NodeBundle):
         app = QtWidgets.QApplication()
         dialog = QtWidgets.QFileDialog(parent=None)
         self.__filepaths = dialog.getOpenFileNames(
-            filter="Spreadsheet files (*.xls *.xlsx *.xlsm *.xlsb *.ods *.csv *.tsv"
+            filter="Spreadsheet files (*.xls *.xlsx *.xlsm *.xlsb *.ods *.csv *.tsv *.parquet *.feather *.arrow)"
         )
         app.shutdown()
 
@@ -238,7 +238,7 @@ class ExportSpreadsheet(NodeBundle):
         app = QtWidgets.QApplication()
         dialog = QtWidgets.QFileDialog(parent=None)
         self.__filepath = dialog.getSaveFileName(
-            filter="Spreadsheet files (*.xls *.xlsx *.xlsm *.xlsb *.ods *.csv *.tsv"
+            filter="Spreadsheet files (*.xls *.xlsx *.xlsm *.xlsb *.ods *.csv *.tsv *.parquet *.feather *.arrow)"
         )
         app.shutdown()
 
@@ -257,6 +257,48 @@ class ExportSpreadsheet(NodeBundle):
             self.__entry_node.set_next(self.__node_0)
 
 
+class PreviewSpreadsheet(NodeBundle):
+
+    """Shows the rows of a dataframe, such as df_matched or a query result, one page at a time"""
+
+    def __init__(self, name, df=None, page_size=20, parent=None):
+        # name is specified in from child class
+        name = name
+        self.df = df
+
+        # OBJECTS
+        self.__table_0 = Table(
+            [], page_size=page_size, command=Command(self._populate_table)
+        )
+
+        # NODES
+        self.__entry_node = Node(
+            self.__table_0, name=f"{name}_preview", show_hideout=True
+        )
+        self.__exit_node = DecoyNode(name=f"{name}_last-node", parent=self.__entry_node)
+
+        self.__entry_node.set_next(self.__exit_node)
+
+        # CONFIGURATIONS
+        self.__table_0.table_header = "Preview"
+
+        super().__init__(self.__entry_node, self.__exit_node, name=name, parent=parent)
+
+    def _populate_table(self, df=None):
+        df = self.df if df is None else df
+
+        if df is None:
+            self.__table_0.table = [["No rows to preview"]]
+            self.__table_0.description = ""
+            return
+
+        # missing values are drawn as empty cells
+        values = df.astype(object).where(df.notna(), None).values.tolist()
+
+        self.__table_0.table = [list(df.columns)] + values
+        self.__table_0.description = f"{len(df)} rows, {len(df.columns)} columns"
+
+
 def _verify_threshold(t):
     try:
         if float(t) >= 0 and float(t) <= 100:
@@ -294,21 +336,22 @@ class TBSettings(NodeBundle):
         )
         self.__node_1 = Node(self.__prompt_1, parent=self.__entry_node, store=False)
 
-        self.__bundle_0 = TBSetColumnsToGet(tb_matcher.config, parent=self.__entry_node)
-        self.__bundle_1 = TBSetColumnsToMatch(tb_matcher.config, parent=self.__entry_node) 
-        self.__bundle_2 = TBSetColumnsToGroup(tb_matcher.config, parent=self.__entry_node)
-        self.__bundle_3 = TBSetColumnThreshold(tb_matcher.config, parent=self.__entry_node)
-        self.__bundle_4 = TBSetColumnScorers(tb_matcher.config, parent=self.__entry_node)
-        self.__bundle_5 = TBSetColumnCutoffs(tb_matcher.config, parent=self.__entry_node)
+        # each setting is built the first time it is chosen
+        self.__bundle_0 = LazyNode(lambda: TBSetColumnsToGet(tb_matcher.config, parent=self.__entry_node),
+                                   name=f"{name}_columns-to-get", parent=self.__entry_node)
+        self.__bundle_1 = LazyNode(lambda: TBSetColumnsToMatch(tb_matcher.config, parent=self.__entry_node),
+                                   name=f"{name}_columns-to-match", parent=self.__entry_node)
+        self.__bundle_2 = LazyNode(lambda: TBSetColumnsToGroup(tb_matcher.config, parent=self.__entry_node),
+                                   name=f"{name}_columns-to-group", parent=self.__entry_node)
+        self.__bundle_3 = LazyNode(lambda: TBSetColumnThreshold(tb_matcher.config, parent=self.__entry_node),
+                                   name=f"{name}_column-thresholds", parent=self.__entry_node)
+        self.__bundle_4 = LazyNode(lambda: TBSetColumnScorers(tb_matcher.config, parent=self.__entry_node),
+                                   name=f"{name}_column-scorers", parent=self.__entry_node)
+        self.__bundle_5 = LazyNode(lambda: TBSetColumnCutoffs(tb_matcher.config, parent=self.__entry_node),
+                                   name=f"{name}_column-cutoffs", parent=self.__entry_node)
         self.__exit_node = DecoyNode(name=f"{name}_last-node")
 
         self.__entry_node.adopt(self.__entry_node)
-        self.__entry_node.adopt(self.__bundle_0.entry_node)
-        self.__entry_node.adopt(self.__bundle_1.entry_node)
-        self.__entry_node.adopt(self.__bundle_2.entry_node)
-        self.__entry_node.adopt(self.__bundle_3.entry_node)
-        self.__entry_node.adopt(self.__bundle_4.entry_node)
-        self.__entry_node.adopt(self.__bundle_5.entry_node)
         self.__node_1.adopt(self.__entry_node)
 
         # CONFIGURATION
@@ -318,27 +361,27 @@ class TBSettings(NodeBundle):
 
         self.__prompt_0.options = {
             "1": Command(
-                lambda: self.__entry_node.set_next(self.__bundle_0.entry_node),
+                lambda: self.__entry_node.set_next(self.__bundle_0),
                 value="Set Columns To Get",
             ),
             "2": Command(
-                lambda: self.__entry_node.set_next(self.__bundle_1.entry_node),
+                lambda: self.__entry_node.set_next(self.__bundle_1),
                 value="Set Columns To Match",
             ),
             "3": Command(
-                lambda: self.__entry_node.set_next(self.__bundle_2.entry_node),
+                lambda: self.__entry_node.set_next(self.__bundle_2),
                 value="Set Columns To Group",
             ),
             "4": Command(
-                lambda: self.__entry_node.set_next(self.__bundle_3.entry_node),
+                lambda: self.__entry_node.set_next(self.__bundle_3),
                 value="Set Column Thresholds",
             ),
             "5": Command(
-                lambda: self.__entry_node.set_next(self.__bundle_4.entry_node),
+                lambda: self.__entry_node.set_next(self.__bundle_4),
                 value="Set Column Scorers",
             ),
             "6": Command(
-                lambda: self.__entry_node.set_next(self.__bundle_5.entry_node),
+                lambda: self.__entry_node.set_next(self.__bundle_5),
                 value="Set Column Cutoffs"
             ),
             "7": Display(
@@ -0,0 +1,153 @@
+# built-ins
+import time
+from dataclasses import dataclass, replace
+
+
+@dataclass
+class ProgressUpdate:
+
+    """
+    What a callback receives from Progress
+
+    Attributes
+    ----------
+    done : float
+        Units of work done in the current phase
+
+    total : float
+        Units of work in the current phase, 0 if unknown
+
+    elapsed : float
+        Seconds since the phase started
+
+    phase : str
+        What is being done, ex. 'Matching', 'Writing'
+
+    unit : str
+        What the work is counted in, ex. 'rows', 'bytes', 'queries'
+
+    finished : bool
+        True on the last update of a phase
+    """
+
+    done: float = 0
+    total: float = 0
+    elapsed: float = 0
+    phase: str = ''
+    unit: str = 'rows'
+    finished: bool = False
+
+    @property
+    def rate(self):
+
+        """Units per second"""
+
+        return self.done / self.elapsed if self.elapsed > 0 else 0
+
+    @property
+    def eta(self):
+
+        """Seconds left, None if the total or the rate is unknown"""
+
+        if not self.total or not self.rate:
+            return None
+
+        return max(self.total - self.done, 0) / self.rate
+
+    def __str__(self):
+        line = f"{self.phase} " if self.phase else ""
+        line += f"{self.done:.0f}/{self.total:.0f} {self.unit}" if self.total else f"{self.done:.0f} {self.unit}"
+        line += f", {self.rate:.0f} {self.unit}/s"
+
+        if self.eta is not None and not self.finished:
+            line += f", ETA {self.eta:.0f}s"
+
+        return line + f" ({self.elapsed:.1f}s)"
+
+
+class Progress:
+
+    """
+    Reports the progress of a task to a callback, ex. progress=print or a cli.objects.Task
+
+    The callback is called with a ProgressUpdate when a phase starts, at most once every
+    interval seconds while work is done, and when a phase finishes. Functions that accept a
+    progress callback only create a Progress when one is given, so nothing is reported
+    or timed otherwise.
+    """
+
+    def __init__(self, callback, phase='', total=0, unit='rows', interval=0.25):
+
+        """
+        Parameters
+        ----------
+        callback : function
+            Takes a ProgressUpdate
+
+        phase, total, unit
+            Of the first phase, see ProgressUpdate
+
+        interval : float, default=0.25
+            Least seconds between two updates within a phase
+        """
+
+        self.callback = callback
+        self.interval = interval
+        self.unit = unit
+
+        self.start(phase, total)
+
+    def start(self, phase, total=0, unit=None):
+
+        """Starts a phase, the work done is counted from 0"""
+
+        if unit:
+            self.unit = unit
+
+        self.__update = ProgressUpdate(total=total or 0, phase=phase, unit=self.unit)
+        self.__start_time = time.perf_counter()
+        self.__reported_at = self.__start_time
+
+        self._report()
+
+    def advance(self, n=1):
+
+        """Adds n units to the work done"""
+
+        self.update(self.__update.done + n)
+
+    def update(self, done, total=None):
+
+        """Sets the work done, and the total if it has changed"""
+
+        self.__update.done = done
+
+        if total is not None:
+            self.__update.total = total
+
+        now = time.perf_counter()
+
+        if now - self.__reported_at >= self.interval:
+            self.__reported_at = now
+            self.__update.elapsed = now - self.__start_time
+            self._report()
+
+    def finish(self, done=None):
+
+        """Finishes the phase, done defaults to the total if there is one"""
+
+        if done is not None:
+            self.__update.done = done
+        elif self.__update.total:
+            self.__update.done = self.__update.total
+
+        self.__update.elapsed = time.perf_counter() - self.__start_time
+        self.__update.finished = True
+        self._report()
+
+        return self.__update
+
+    def _report(self):
+
+        # a copy, so a callback can keep the updates it receives
+        self.callback(replace(self.__update))
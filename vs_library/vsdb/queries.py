@@ -1,5 +1,41 @@
 
 
+# built-ins
+import itertools
+
+
+def partition(query, by='states', size=1):
+
+    """
+    Splits a query into independent queries that each take a part of its list parameters,
+    so they can run concurrently, see QueryTool.run_partitioned
+
+    Parameters
+    ----------
+    query : (statement, params)
+        Ex. Incumbents(...).by_congstatus() or ElectionCandidates(...).by_yoss()
+
+    by : str or list, default='states'
+        List parameter(s) to split on, ex. ['states', 'election_years'].
+        Several parameters are split on every combination of their parts
+
+    size : int, default=1
+        Number of values of a parameter given to each query
+    
+    Returns
+    -------
+    [(statement, params)...]
+    """
+
+    statement, params = query
+    by = [by] if isinstance(by, str) else list(by)
+
+    parts = [[params[key][i:i + size] for i in range(0, len(params[key]), size)] for key in by]
+
+    return [(statement, {**params, **dict(zip(by, combination))}) 
+            for combination in itertools.product(*parts)]
+
+
 class Incumbents:
 
     """Holds a query statement that query for Incumbents (office_candidates) on Vote Smart's database."""
@@ -28,6 +64,90 @@ class Incumbents:
         LEFT JOIN office_candidate_party USING (office_candidate_id)
         LEFT JOIN party USING (party_id)
         '''
+
+    # statements are complete at import, only the parameters differ between instances
+    congstatus_statement = statement + \
+        '''
+        JOIN congstatus_candidate USING (office_candidate_id)
+        JOIN congstatus USING (congstatus_id)
+
+        WHERE congstatus.statusdate BETWEEN :start_date AND :end_date
+        AND office_candidate.state_id = ANY(:states::TEXT[])
+        AND (office.office_id = ANY(:office_ids::INTEGER[])
+             OR office.officetype_id = ANY(:office_types::TEXT[]))
+        '''
+
+    # only actions recorded on or after the watermark, see by_congstatus_since,
+    # actions of the watermark's date may have been added after it was taken
+    congstatus_since_statement = congstatus_statement + \
+        '''
+        AND congstatus.statusdate >= :watermark
+        '''
+
+    # the watermark of by_congstatus is the most recent action recorded
+    congstatus_watermark_statement = 'SELECT max(statusdate) FROM congstatus'
+
+    electdates_statement = \
+        '''
+        WITH local_var AS (
+            SELECT :start_date::DATE AS termstarts,
+                   :end_date::DATE AS termends
+            )
+        ''' + statement + \
+        '''
+        CROSS JOIN local_var
+        
+        WHERE 
+            (to_date(termend, 'mm/dd/yyyy') > local_var.termstarts
+            OR to_date(termend, 'mm/yyyy') > local_var.termstarts
+            OR to_date(termend, 'yyyy') > local_var.termstarts
+            OR CASE WHEN termend ISNULL THEN now() END > local_var.termstarts)
+
+        AND (to_date(termstart, 'mm/dd/yyyy') < local_var.termends
+            /* converting a full date ('mm/dd/yyyy') by partial match ('mm/yyyy' or 'yyyy') 
+            would turn it into a smaller date, so the smaller date has to be larger than the
+            termstart*/
+            OR (to_date(termstart, 'mm/yyyy') < local_var.termends
+                AND to_date(termstart, 'mm/yyyy') > local_var.termstarts)
+            OR (to_date(termstart, 'yyyy') < local_var.termends
+                AND to_date(termstart, 'yyyy') > local_var.termstarts)
+            OR (CASE WHEN termstart ISNULL THEN 
+                    (CASE WHEN officecandidatestatus_id = 1 THEN now() END < local_var.termends)
+                END)
+            )
+        
+        AND office_candidate.state_id = ANY(:states::TEXT[])
+        AND (office.office_id = ANY(:office_ids::INTEGER[])
+             OR office.officetype_id = ANY(:office_types::TEXT[]))
+        '''
+
+    # range predicates over TermDates, which term dates are parsed once when it is refreshed,
+    # each condition leads with a range on a single indexed column of the view
+    termdates_statement = statement + \
+        '''
+        JOIN office_candidate_termdate USING (office_candidate_id)
+
+        WHERE 
+            /* a missing termend is 'infinity', the term has not ended,
+            which only counts if the period has started */
+            office_candidate_termdate.termend_until > :start_date::DATE
+            AND (office_candidate_termdate.termend_until < 'infinity' OR now() > :start_date::DATE)
+
+            /* a missing termstart of an incumbent (status 1) is '-infinity',
+            which only counts if the period has not ended */
+            AND office_candidate_termdate.termstart_from < :end_date::DATE
+            AND (office_candidate_termdate.termstart_from > '-infinity' OR now() < :end_date::DATE)
+
+            /* partial dates ('mm/yyyy' or 'yyyy') are the smallest date they can be, 
+            so they also have to be larger than the start of the term */
+            AND (office_candidate_termdate.termstart_precision = 'D'
+                 OR office_candidate_termdate.termstart_from > :start_date::DATE)
+
+        AND office_candidate.state_id = ANY(:states::TEXT[])
+        AND (office.office_id = ANY(:office_ids::INTEGER[])
+             OR office.officetype_id = ANY(:office_types::TEXT[]))
+        '''
+
     # parameters are declared during construction as they will be used in instance methods
     def __init__(self, active_years, office_ids, office_types, states):
 
@@ -49,82 +169,141 @@ class Incumbents:
             contains the state abbreviations of the incumbent's office
         """
 
+        # list parameters are bound as arrays so the statement text never changes with their length,
+        # lists are replaced with an empty placeholder if not given so query could run
         self.__conditions = {'year': int(max(active_years)),
                              'start_date': f'01-01-{min(active_years)}',
-                             'end_date': f'01-03-{int(max(active_years)) + 1}'}
-
-        # dict keys-value will be replace with an empty placeholder if not given so query could run
-        self.__enum_office_ids = {f"office_id_{k}": v for k, v in enumerate(office_ids)
-                                 } if office_ids else {"office_id_0": -1}
-        self.__enum_office_types = {f"office_type_{k}": str(v) for k, v in enumerate(office_types)
-                                   } if office_types else {"office_type_0": ''}
-        self.__enum_states = {f"state_{k}": v for k, v in enumerate(states)}
-
-        self.__conditions.update(self.__enum_office_ids)
-        self.__conditions.update(self.__enum_office_types)
-        self.__conditions.update(self.__enum_states)
+                             'end_date': f'01-03-{int(max(active_years)) + 1}',
+                             'office_ids': [int(v) for v in office_ids] if office_ids else [-1],
+                             'office_types': [str(v) for v in office_types] if office_types else [''],
+                             'states': [str(v) for v in states]}
 
     def by_congstatus(self):
 
         """Add conditions to query based on actions taken by incumbents on key legislations,
            only applies actively on for certain offices that can vote on legislations"""
 
-        statement = \
-            '''
-            JOIN congstatus_candidate USING (office_candidate_id)
-            JOIN congstatus USING (congstatus_id)
+        return Incumbents.congstatus_statement, self.__conditions
+
+    def by_congstatus_since(self, watermark):
 
-            WHERE congstatus.statusdate BETWEEN :start_date AND :end_date
-            AND office_candidate.state_id IN ({states})
-            AND (office.office_id IN ({office_ids})
-                 OR office.officetype_id IN ({office_types}))
-            '''.format(states=','.join([f':{k}' for k in self.__enum_states.keys()]),
-                 office_types=','.join([f':{k}' for k in self.__enum_office_types.keys()]),
-                   office_ids=','.join([f':{k}' for k in self.__enum_office_ids.keys()]))
+        """Same as by_congstatus, but only for actions recorded on or after the watermark"""
 
-        return Incumbents.statement + statement, self.__conditions
+        return Incumbents.congstatus_since_statement, {**self.__conditions, 'watermark': watermark}
 
     def by_electdates(self):
 
         """Dates when incumbents are elected to their offices and when they resign"""
-        pre_statement = \
-            '''
-            WITH local_var AS (
-                SELECT :start_date::DATE AS termstarts,
-		               :end_date::DATE AS termends
-                )
-            '''
-        statement = \
-            '''
-            CROSS JOIN local_var
-            
-            WHERE 
-                (to_date(termend, 'mm/dd/yyyy') > local_var.termstarts
-		        OR to_date(termend, 'mm/yyyy') > local_var.termstarts
-		        OR to_date(termend, 'yyyy') > local_var.termstarts
-		        OR CASE WHEN termend ISNULL THEN now() END > local_var.termstarts)
-
-	        AND (to_date(termstart, 'mm/dd/yyyy') < local_var.termends
-		        /* converting a full date ('mm/dd/yyyy') by partial match ('mm/yyyy' or 'yyyy') 
-		        would turn it into a smaller date, so the smaller date has to be larger than the
-		        termstart*/
-		        OR (to_date(termstart, 'mm/yyyy') < local_var.termends
-		        	AND to_date(termstart, 'mm/yyyy') > local_var.termstarts)
-		        OR (to_date(termstart, 'yyyy') < local_var.termends
-                    AND to_date(termstart, 'yyyy') > local_var.termstarts)
-                OR (CASE WHEN termstart ISNULL THEN 
-			            (CASE WHEN officecandidatestatus_id = 1 THEN now() END < local_var.termends)
-			        END)
-                )
-            
-            AND office_candidate.state_id IN ({states})
-            AND (office.office_id IN ({office_ids})
-                 OR office.officetype_id IN ({office_types}))
-            '''.format(office_ids=','.join([f':{k}' for k in self.__enum_office_ids.keys()]),
-                     office_types=','.join([f':{k}' for k in self.__enum_office_types.keys()]),
-                           states=','.join([f':{k}' for k in self.__enum_states.keys()]))
-
-        return pre_statement + Incumbents.statement + statement, self.__conditions
+
+        return Incumbents.electdates_statement, self.__conditions
+
+    def by_termdates(self):
+
+        """Same conditions as by_electdates, but compares the term dates normalized by TermDates
+           so that indexes can be used. TermDates has to be created on the database beforehand"""
+
+        return Incumbents.termdates_statement, self.__conditions
+
+
+class TermDates:
+
+    """Holds the statements that keep a materialized view of office_candidate term dates 
+       parsed into dates, which allows Incumbents.by_termdates to use range predicates"""
+
+    # termstart and termend are text as 'mm/dd/yyyy', 'mm/yyyy' or 'yyyy'
+    # precision is 'D' for a full date, 'M' for a month and 'Y' for a year
+    # missing dates are kept as the infinite dates by_electdates treats them as,
+    # so that the view depends on officecandidatestatus_id as well
+    create_statements = (
+        '''
+        CREATE MATERIALIZED VIEW IF NOT EXISTS office_candidate_termdate AS
+        SELECT office_candidate_id,
+
+        /* a term without termstart is only counted for incumbents (status 1) */
+        CASE WHEN termstart ISNULL AND officecandidatestatus_id = 1 THEN '-infinity'::DATE
+             WHEN termstart ~ '^\\d{1,2}/\\d{1,2}/\\d{4}$' THEN to_date(termstart, 'mm/dd/yyyy')
+             WHEN termstart ~ '^\\d{1,2}/\\d{4}$' THEN to_date(termstart, 'mm/yyyy')
+             WHEN termstart ~ '^\\d{4}$' THEN to_date(termstart, 'yyyy')
+        END AS termstart_from,
+
+        /* a missing termstart is not a partial date */
+        CASE WHEN termstart ISNULL THEN 'D'
+             WHEN termstart ~ '^\\d{1,2}/\\d{1,2}/\\d{4}$' THEN 'D'
+             WHEN termstart ~ '^\\d{1,2}/\\d{4}$' THEN 'M'
+             WHEN termstart ~ '^\\d{4}$' THEN 'Y'
+        END AS termstart_precision,
+
+        /* a term without termend has not ended */
+        CASE WHEN termend ISNULL THEN 'infinity'::DATE
+             WHEN termend ~ '^\\d{1,2}/\\d{1,2}/\\d{4}$' THEN to_date(termend, 'mm/dd/yyyy')
+             WHEN termend ~ '^\\d{1,2}/\\d{4}$' THEN to_date(termend, 'mm/yyyy')
+             WHEN termend ~ '^\\d{4}$' THEN to_date(termend, 'yyyy')
+        END AS termend_until
+
+        FROM office_candidate
+        ''',
+        # a unique index is required to refresh the view concurrently
+        '''
+        CREATE UNIQUE INDEX IF NOT EXISTS office_candidate_termdate_id_idx 
+        ON office_candidate_termdate (office_candidate_id)
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS office_candidate_termdate_termend_idx 
+        ON office_candidate_termdate (termend_until)
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS office_candidate_termdate_termstart_idx 
+        ON office_candidate_termdate (termstart_from)
+        '''
+        )
+
+    refresh_statement = 'REFRESH MATERIALIZED VIEW CONCURRENTLY office_candidate_termdate'
+
+    drop_statement = 'DROP MATERIALIZED VIEW IF EXISTS office_candidate_termdate'
+
+    @staticmethod
+    def create(connection_adapter):
+
+        """
+        Creates the materialized view and its indexes if they do not exist
+
+        Parameters
+        ----------
+        connection_adapter : vs_library.database.PostgreSQL
+            A connected adapter with privileges to create on the database
+        """
+
+        return TermDates._run(connection_adapter, TermDates.create_statements, 
+                              "Term dates are created.")
+
+    @staticmethod
+    def refresh(connection_adapter):
+
+        """
+        Parses the term dates of office_candidate again, reads are not blocked while refreshing.
+        Run after term dates or officecandidatestatus_id change
+        """
+
+        return TermDates._run(connection_adapter, (TermDates.refresh_statement,), 
+                              "Term dates are refreshed.")
+
+    @staticmethod
+    def drop(connection_adapter):
+        return TermDates._run(connection_adapter, (TermDates.drop_statement,), 
+                              "Term dates are dropped.")
+
+    @staticmethod
+    def _run(connection_adapter, statements, message):
+        try:
+            for statement in statements:
+                connection_adapter.execute(statement).close()
+            connection_adapter.commit()
+
+            return True, message
+
+        except Exception as e:
+            connection_adapter.rollback()
+            return False, f"ERROR: {str(e)}"
 
 
 class ElectionCandidates:
@@ -158,6 +337,17 @@ class ElectionCandidates:
         LEFT JOIN electionstage_candidate_party USING (electionstage_candidate_id)
         LEFT JOIN party ON electionstage_candidate_party.party_id = party.party_id
         '''
+
+    # statements are complete at import, only the parameters differ between instances
+    yoss_statement = statement + \
+        '''
+        WHERE election.electionyear = ANY(:election_years::INTEGER[])
+        AND election_electionstage.electionstage_id = ANY(:election_stages::TEXT[])
+        AND (office.office_id = ANY(:office_ids::INTEGER[])
+            OR office.officetype_id = ANY(:office_types::TEXT[]))
+        AND election_candidate.state_id = ANY(:states::TEXT[])
+        '''
+
     # parameters are declared during construction as they will be used in instance methods
     def __init__(self, election_years, election_stages, office_ids, office_types, states):
 
@@ -183,32 +373,16 @@ class ElectionCandidates:
             contains the state abbreviations of the incumbent's office
         """
 
-        self.__enum_election_years = {f"election_year_{k}": int(v) for k, v in enumerate(election_years)}
-        self.__enum_election_stages = {f"election_stage_{k}": v for k, v in enumerate(election_stages)}
-        self.__enum_office_ids = {f"office_id_{k}": v for k, v in enumerate(office_ids)
-                                 } if office_ids else {'office_id_0':-1}
-        self.__enum_office_types = {f"office_type_{k}": str(v) for k, v in enumerate(office_types)
-                                   } if office_types else {'office_type_0':''}
-        self.__enum_states = {f"state_{k}": v for k, v in enumerate(states)}
-
-        self.__conditions = {**self.__enum_election_years, **self.__enum_election_stages, **self.__enum_office_ids,
-                             **self.__enum_office_types, **self.__enum_states}
+        # list parameters are bound as arrays so the statement text never changes with their length,
+        # lists are replaced with an empty placeholder if not given so query could run
+        self.__conditions = {'election_years': [int(v) for v in election_years],
+                             'election_stages': [str(v) for v in election_stages],
+                             'office_ids': [int(v) for v in office_ids] if office_ids else [-1],
+                             'office_types': [str(v) for v in office_types] if office_types else [''],
+                             'states': [str(v) for v in states]}
 
     def by_yoss(self):
         
         """Adds conditions to the statement considering years, office, stage and state (yoss)."""
 
-        statement = \
-            '''
-            WHERE election.electionyear IN ({election_years})
-            AND election_electionstage.electionstage_id IN ({election_stages})
-            AND (office.office_id IN ({office_ids})
-                OR office.officetype_id IN ({office_types}))
-            AND election_candidate.state_id IN ({states})
-            '''.format(election_years=','.join([f':{k}' for k in self.__enum_election_years.keys()]),
-                      election_stages=','.join([f':{k}' for k in self.__enum_election_stages.keys()]),
-                           office_ids=','.join([f':{k}' for k in self.__enum_office_ids.keys()]),
-                         office_types=','.join([f':{k}' for k in self.__enum_office_types.keys()]),
-                               states=','.join([f':{k}' for k in self.__enum_states.keys()]))
-
-        return ElectionCandidates.statement + statement, self.__conditions
+        return ElectionCandidates.yoss_statement, self.__conditions
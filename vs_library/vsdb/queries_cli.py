@@ -42,7 +42,8 @@ class IncumbentQueryForm(NodeBundle):
 
         # OBJECTS
         self.__display_0 = Display(textformat.apply("Incumbent Query Form", 
-                                                    emphases=['bold', 'underline']))
+                                                    emphases=['bold', 'underline']),
+                                   command=Command(self._refresh_options))
         
         self.__prompt_0 = Prompt("Which of the following information do you have?")
         self.__prompt_1 = Prompt("Which of the following office(s) are of these incumbents?", 
@@ -102,9 +103,9 @@ class IncumbentQueryForm(NodeBundle):
                          command=Command(self.__prompt_1.clear))
             }
 
-        self.__prompt_1.options = references.OFFICE
-        self.__prompt_2.options = references.OFFICE_TYPE
-        self.__prompt_5.options = references.STATE| {'**': 'ALL'}
+        self.__prompt_1.options = references.table('OFFICE')
+        self.__prompt_2.options = references.table('OFFICE_TYPE')
+        self.__prompt_5.options = references.table('STATE') | {'**': 'ALL'}
 
         # by_congstatus only works if incumbents are over year 2005
         self.__prompt_3.command = Command(lambda: self.__node_3.set_next(self.__node_4) 
@@ -131,6 +132,15 @@ class IncumbentQueryForm(NodeBundle):
         self.__prompt_4.clear()
         self.__prompt_5.clear()
 
+    def _refresh_options(self):
+        # only once the cache expires and a connection is already open, the cached options are used otherwise
+        if references.loader.expired and self.query_tool.connection_adapter.connected:
+            references.refresh(self.query_tool)
+
+            self.__prompt_1.options = references.table('OFFICE')
+            self.__prompt_2.options = references.table('OFFICE_TYPE')
+            self.__prompt_5.options = references.table('STATE') | {'**': 'ALL'}
+
     def _execute(self):
         legislative = self.__prompt_4.option_responses(string=True)
         office_ids = self.__prompt_1.responses
@@ -169,7 +179,8 @@ class CandidateQueryForm(NodeBundle):
 
         # OBJECTS
         self.__display_0 = Display(textformat.apply("Candidate Query Form", 
-                                                    emphases=['bold', 'underline']))
+                                                    emphases=['bold', 'underline']),
+                                   command=Command(self._refresh_options))
         self.__prompt_0 = Prompt("What are the election stage(s) of these candidates?",  
                                  multiple_selection=True)
         self.__prompt_1 = Prompt("Which of the following information do you have?")
@@ -213,7 +224,7 @@ class CandidateQueryForm(NodeBundle):
         self.__table_0.table_header = "Response"
         self.__table_0.description = "Shows the filled candidate query form"
 
-        self.__prompt_0.options = references.ELECTION_STAGE
+        self.__prompt_0.options = references.table('ELECTION_STAGE')
 
         self.__prompt_1.options = {
             '1': Command(lambda: self.__node_1.set_next(self.__node_2), value='Office ID',
@@ -222,9 +233,9 @@ class CandidateQueryForm(NodeBundle):
                          command=Command(self.__prompt_2.clear))
             }
 
-        self.__prompt_2.options = references.OFFICE
-        self.__prompt_3.options = references.OFFICE_TYPE
-        self.__prompt_5.options = references.STATE | {'**': "ALL"}
+        self.__prompt_2.options = references.table('OFFICE')
+        self.__prompt_3.options = references.table('OFFICE_TYPE')
+        self.__prompt_5.options = references.table('STATE') | {'**': "ALL"}
 
         self.__prompt_6.options = {
             '1': Command(self._execute, value="Yes",
@@ -246,6 +257,16 @@ class CandidateQueryForm(NodeBundle):
         self.__prompt_4.clear()
         self.__prompt_5.clear()
 
+    def _refresh_options(self):
+        # only once the cache expires and a connection is already open, the cached options are used otherwise
+        if references.loader.expired and self.query_tool.connection_adapter.connected:
+            references.refresh(self.query_tool)
+
+            self.__prompt_0.options = references.table('ELECTION_STAGE')
+            self.__prompt_2.options = references.table('OFFICE')
+            self.__prompt_3.options = references.table('OFFICE_TYPE')
+            self.__prompt_5.options = references.table('STATE') | {'**': "ALL"}
+
     def _execute(self):
         election_stages = self.__prompt_0.responses
         office_ids = self.__prompt_2.responses
@@ -1,3 +1,16 @@
+# built-ins
+import os
+import re
+import json
+import time
+from types import MappingProxyType
+
+# external packages
+import numpy
+import pandas
+from rapidfuzz import fuzz, process
+
+
 
 # Key-value pair between office_id and name of office from the 'office' table
 # Queried from: SELECT office_id, name FROM office ORDER BY rank LIMIT(9)
@@ -83,4 +96,281 @@ STATE = {
     'SC': 'South Carolina', 'SD': 'South Dakota', 'TN': 'Tennessee', 'TX': 'Texas',
     'UT': 'Utah', 'VI': 'Virgin Islands' ,'VT': 'Vermont', 'VA': 'Virginia', 'WA': 'Washington',
     'WV': 'West Virginia', 'WI': 'Wisconsin', 'WY': 'Wyoming'
-}
\ No newline at end of file
+}
+
+
+# the statements the tables above are refreshed from, each returns (id, name) rows
+# OFFICE is a selection of offices, so only their names are refreshed
+STATEMENTS = {
+    'OFFICE': f"SELECT office_id, name FROM office WHERE office_id IN ({', '.join(OFFICE)}) ORDER BY rank",
+    'OFFICE_TYPE': "SELECT officetype_id, name FROM officetype WHERE officelevel_id != 'L' ORDER BY rank",
+    'ELECTION_STAGE': "SELECT electionstage_id, name FROM electionstage",
+    'RATING_FORMAT': "SELECT * FROM ratingformat",
+    'RATING_SESSION': "SELECT * FROM ratingsession",
+    'FINSOURCE': "SELECT finsource_id, name FROM finsource",
+    'STATE': "SELECT state_id, name FROM state"
+    }
+
+# cache files written with a different version are ignored
+CACHE_VERSION = 1
+
+# seconds before a cache is refreshed, a week by default
+CACHE_TTL = 7 * 24 * 60 * 60
+
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.vs_library', 'references.json')
+
+
+class ReferenceLoader:
+
+    """
+    Keeps the reference tables in a local cache file, so they are queried from the database
+    once every CACHE_TTL seconds instead of on every startup
+
+    The cache is read the first time a table is requested. Tables missing from the cache,
+    or a missing, unreadable or outdated cache, fall back to the dicts of this module.
+    """
+
+    def __init__(self, filepath=CACHE_PATH, ttl=CACHE_TTL):
+
+        """
+        Parameters
+        ----------
+        filepath : str, default=CACHE_PATH
+            Location of the cache file
+
+        ttl : int or float, default=CACHE_TTL
+            Seconds after which the cache is expired
+        """
+
+        self.filepath = filepath
+        self.ttl = ttl
+
+        self.__tables = None
+        self.__refreshed_at = None
+        self.__indexes = {}
+
+    @property
+    def refreshed_at(self):
+        self._load()
+        return self.__refreshed_at
+
+    @property
+    def expired(self):
+        return self.refreshed_at is None or time.time() - self.refreshed_at > self.ttl
+
+    def table(self, name):
+
+        """Returns the {id: name} dict of a reference table, e.g. 'STATE'"""
+
+        self._load()
+        return dict(self.__tables.get(name) or globals()[name])
+
+    def index(self, name):
+
+        """Returns the ReferenceIndex of a reference table, built once per table until the next refresh"""
+
+        if name not in self.__indexes:
+            self.__indexes[name] = ReferenceIndex(self.table(name))
+
+        return self.__indexes[name]
+
+    def refresh(self, query_tool):
+
+        """
+        Queries every reference table and writes them to the cache file
+
+        Parameters
+        ----------
+        query_tool : vs_library.database.QueryTool
+
+        Returns
+        -------
+        (bool, str)
+            True if every table is refreshed, tables that fail keep their previous values,
+            the cache is only written if at least one table is refreshed
+        """
+
+        success, message = query_tool.run_batch({name: (statement,) for name, statement in STATEMENTS.items()})
+
+        self._load()
+        tables = dict(self.__tables)
+        refreshed = 0
+
+        for name, (rows, _) in query_tool.batch_results().items():
+            if rows:
+                tables[name] = {str(row[0]): str(row[1]) for row in rows}
+                refreshed += 1
+
+        # the cache stays expired so the refresh is tried again
+        if not refreshed:
+            return False, f"No reference table was refreshed. {message}"
+
+        try:
+            os.makedirs(os.path.dirname(self.filepath) or '.', exist_ok=True)
+
+            refreshed_at = time.time()
+            with open(self.filepath, 'w') as f:
+                json.dump({'version': CACHE_VERSION, 'refreshed_at': refreshed_at, 'tables': tables}, f, indent=2)
+
+            self.__tables = tables
+            self.__refreshed_at = refreshed_at
+            self.__indexes = {}
+
+        except Exception as e:
+            return False, f"ERROR: {str(e)}"
+
+        return success, f"References refreshed. {message}"
+
+    def _load(self):
+
+        """Reads the cache file once, the bundled tables are used if it cannot be read"""
+
+        if self.__tables is not None:
+            return
+
+        self.__tables = {}
+
+        try:
+            with open(self.filepath) as f:
+                cache = json.load(f)
+
+            if cache.get('version') == CACHE_VERSION:
+                self.__tables = cache['tables']
+                self.__refreshed_at = cache['refreshed_at']
+
+        except (OSError, ValueError, KeyError):
+            pass
+
+
+def normalize(text):
+
+    """Lowercases text and drops punctuation and repeated whitespace, e.g. ' U.S.  House' becomes 'us house'"""
+
+    return re.sub(r'\s+', ' ', re.sub(r'[^\w\s]', '', str(text).casefold())).strip()
+
+
+class ReferenceIndex:
+
+    """
+    A read-only index of a reference table in both directions, id to name and name to id
+
+    Names are matched after normalize(), and ids are accepted in place of names,
+    so 'texas', ' TX' and 'Texas' all resolve to 'TX'. Names that still do not match
+    are compared to every name with a similarity score.
+    """
+
+    __slots__ = ('__names', '__ids', '__choices')
+
+    def __init__(self, table):
+
+        """
+        Parameters
+        ----------
+        table : dict
+            {id: name}, e.g. STATE
+        """
+
+        ids = {normalize(name): key for key, name in table.items()}
+        ids.update({normalize(key): key for key in table})
+
+        self.__names = MappingProxyType(dict(table))
+        self.__ids = MappingProxyType(ids)
+        self.__choices = tuple(ids)
+
+    def __len__(self):
+        return len(self.__names)
+
+    def __contains__(self, key):
+        return key in self.__names
+
+    @property
+    def names(self):
+        return self.__names
+
+    @property
+    def ids(self):
+        return self.__ids
+
+    def name(self, key, default=None):
+
+        """Returns the name of an id"""
+
+        return self.__names.get(key, default)
+
+    def id(self, name, cutoff=85):
+
+        """
+        Returns the id of a name, or None if there is no match
+
+        Parameters
+        ----------
+        name : str
+            A name or an id, in any case or spacing
+
+        cutoff : int or float, default=85
+            Lowest similarity (0 to 100) for a name that does not match exactly,
+            None to only accept exact matches
+        """
+
+        normalized = normalize(name)
+
+        if normalized in self.__ids:
+            return self.__ids[normalized]
+
+        if cutoff is None or not normalized:
+            return None
+
+        match = process.extractOne(normalized, self.__choices, scorer=fuzz.ratio, score_cutoff=cutoff)
+
+        return self.__ids[match[0]] if match else None
+
+    def resolve(self, series, cutoff=85):
+
+        """
+        Returns the ids of a pandas.Series of names, unmatched names and missing values are None
+
+        Each distinct value is resolved once and the results are mapped back by position,
+        so the cost depends on the number of distinct values rather than the length of the series.
+
+        Parameters
+        ----------
+        series : pandas.Series
+
+        cutoff : int or float, default=85
+            See ReferenceIndex.id
+        """
+
+        codes, uniques = pandas.factorize(series, use_na_sentinel=True)
+
+        resolved = numpy.array([self.id(value, cutoff) for value in uniques] + [None], dtype=object)
+
+        # missing values have the code -1, which picks the None at the end
+        return pandas.Series(resolved[codes], index=series.index, name=series.name)
+
+
+# the loader used by table(), index() and refresh()
+loader = ReferenceLoader()
+
+
+def table(name):
+
+    """Returns the {id: name} dict of a reference table from the cache, see ReferenceLoader"""
+
+    return loader.table(name)
+
+
+def index(name):
+
+    """Returns the ReferenceIndex of a reference table from the cache, see ReferenceIndex"""
+
+    return loader.index(name)
+
+
+def refresh(query_tool, force=False):
+
+    """Refreshes the cached reference tables if they are expired, or always if force is True"""
+
+    if not force and not loader.expired:
+        return True, "References are up to date."
+
+    return loader.refresh(query_tool)